@@ -0,0 +1,128 @@
+"""
+HFC AI Assistant - HTTP API Entry Point
+Headless async service for web, WhatsApp and kiosk front ends
+
+Usage:
+    python api.py                      # API_HOST:API_PORT, API_WORKERS processes
+    uvicorn api:app --workers 4
+"""
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from configure import Config
+from src.llm.chains import HFCAgent
+from src.llm.memory import ConversationMemory
+
+
+class ChatRequest(BaseModel):
+    question: str = Field(..., min_length=1, max_length=2000)
+    conversation_id: Optional[str] = Field(None, max_length=128)
+
+
+class Conversations:
+    """Memory per conversation id, least recently used dropped past the limit"""
+
+    def __init__(self, max_conversations: int):
+        self.max_conversations = max_conversations
+        self._memories: "OrderedDict[str, ConversationMemory]" = OrderedDict()
+
+    def get(self, conversation_id: Optional[str]) -> Optional[ConversationMemory]:
+        if not conversation_id:
+            return None
+        memory = self._memories.get(conversation_id)
+        if memory is None:
+            memory = self._memories[conversation_id] = ConversationMemory(agent.tokens)
+        self._memories.move_to_end(conversation_id)
+        while len(self._memories) > self.max_conversations:
+            self._memories.popitem(last=False)
+        return memory
+
+
+# One agent (and data snapshot) per worker process, shared by every request
+agent: Optional[HFCAgent] = None
+conversations = Conversations(Config.API_MAX_CONVERSATIONS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global agent
+    agent = await run_in_threadpool(HFCAgent)
+    yield
+    agent.stop_refresher()
+
+
+app = FastAPI(title=Config.PROJECT_NAME, version=Config.VERSION, lifespan=lifespan)
+
+
+@app.get("/health")
+async def health():
+    return {"ok": agent is not None and agent.data is not None}
+
+
+@app.post("/chat")
+async def chat(request: ChatRequest):
+    """Full answer plus source, token usage and latency"""
+    return await agent.aanswer(request.question, conversations.get(request.conversation_id))
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """Answer text streamed as it is generated"""
+    memory = conversations.get(request.conversation_id)
+    # Sync generator: Starlette iterates it in the thread pool
+    return StreamingResponse(
+        agent.stream_query(request.question, memory),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
+@app.get("/status")
+async def status():
+    return agent.get_status()
+
+
+@app.get("/menu/search")
+async def menu_search(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=100)):
+    data = agent.data
+    if not data:
+        raise HTTPException(status_code=503, detail="Restaurant data not loaded")
+    return {
+        "query": q,
+        "items": [
+            {
+                "name": item.name,
+                "category": item.category,
+                "price": item.price_text,
+                "available": item.available,
+                "bestseller": item.bestseller,
+                "spicy": item.spicy,
+                "description": item.description
+            }
+            for item in data.search_menu(q, limit)
+        ]
+    }
+
+
+@app.post("/refresh")
+async def refresh():
+    """Re-fetch the sheets now (the background refresher also does this periodically)"""
+    ok = await run_in_threadpool(agent.refresh_data)
+    if not ok:
+        raise HTTPException(status_code=503, detail="Restaurant data not loaded")
+    return {"ok": True, "data_version": agent.data.version}
+
+
+def main():
+    uvicorn.run("api:app", host=Config.API_HOST, port=Config.API_PORT, workers=Config.API_WORKERS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+HFC AI Assistant - Batch Query Entry Point
+Answer a file of questions and write results as JSONL
+
+Usage:
+    python batch.py questions.txt -o answers.jsonl --concurrency 8
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections import Counter
+from typing import List
+
+from configure import Config
+from src.llm.chains import HFCAgent
+
+
+def read_questions(path: str) -> List[str]:
+    """One question per line, or JSONL with a "question" field"""
+    questions = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.endswith(".jsonl"):
+                line = json.loads(line)["question"]
+            questions.append(line)
+    return questions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Answer a file of questions with HFCAgent")
+    parser.add_argument("questions", help="text file (one per line) or .jsonl with a question field")
+    parser.add_argument("-o", "--output", required=True, help="JSONL output path")
+    parser.add_argument("-c", "--concurrency", type=int, default=Config.BATCH_CONCURRENCY)
+    args = parser.parse_args()
+
+    questions = read_questions(args.questions)
+
+    Config.REFRESH_INTERVAL = 0  # one-shot run, no background refresher
+    agent = HFCAgent()
+
+    start = time.perf_counter()
+    results = agent.process_many(questions, max_concurrency=args.concurrency)
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, "w", encoding="utf-8") as out:
+        for question, result in zip(questions, results):
+            out.write(json.dumps({"question": question, **result}, ensure_ascii=False) + "\n")
+
+    latencies = sorted(r["latency_ms"] for r in results) or [0.0]
+    sources = Counter(r["source"] for r in results)
+    print(
+        f"{len(questions)} questions in {elapsed:.2f}s ({len(questions) / max(elapsed, 1e-9):.1f}/s), "
+        f"p50 {statistics.median(latencies):.0f} ms, max {latencies[-1]:.0f} ms - "
+        + ", ".join(f"{k}: {v}" for k, v in sources.most_common())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark - Chat throughput: HTTP API (one shared agent) vs the Streamlit script path
+
+Usage:
+    python -m benchmarks.bench_api --requests 200 --concurrency 1 8 32 --latency 0.3
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from configure import Config
+from benchmarks.local_llm import LocalChatServer
+from benchmarks.local_sheets import LocalSheetsServer
+from benchmarks.synthetic import all_sheets
+
+QUESTIONS = [
+    "Are you open now?",
+    "Where are you located?",
+    "How much is the spicy zinger burger?",
+    "Is the chicken wrap spicy?",
+    "Do you have vegetarian options?",
+    "What comes with the family meal?",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api(port: int):
+    import uvicorn
+    import api
+
+    server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def api_latencies(port: int, questions, concurrency: int) -> list:
+    local = threading.local()
+
+    def ask(question: str) -> float:
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        body = json.dumps({"question": question})
+        start = time.perf_counter()
+        local.conn.request("POST", "/chat", body, {"Content-Type": "application/json"})
+        response = local.conn.getresponse()
+        response.read()
+        assert response.status == 200, response.status
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        return list(pool.map(ask, questions))
+
+
+def streamlit_latencies(questions) -> list:
+    """One fresh session per question: load page, submit the form, render the answer"""
+    from streamlit.testing.v1 import AppTest
+
+    runs = []
+    for question in questions:
+        start = time.perf_counter()
+        app = AppTest.from_file(str(Config.BASE_DIR / "main.py"), default_timeout=120)
+        app.run()
+        app.text_input(key="user_input").input(question)
+        next(b for b in app.button if b.label == "➤").click().run()
+        if app.session_state["waiting_response"]:
+            app.run()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def summary(name: str, runs: list, elapsed: float):
+    runs = sorted(runs)
+    p99 = runs[max(0, int(len(runs) * 0.99) - 1)]
+    print(f"  {name:30s} {len(runs) / elapsed:7.1f} req/s   p50 {statistics.median(runs) * 1000:7.1f} ms"
+          f"   p99 {p99 * 1000:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0.3, help="stub LLM time per completion (s)")
+    parser.add_argument("--streamlit-requests", type=int, default=10)
+    args = parser.parse_args()
+
+    # Numbered so the response cache and coalescing don't hide LLM calls
+    questions = [f"{QUESTIONS[i % len(QUESTIONS)]} (#{i})" for i in range(args.requests)]
+
+    sheets = all_sheets(200)
+    with LocalSheetsServer(sheets) as sheets_server, LocalChatServer(args.latency) as llm_server:
+        Config.SHEET_IDS = {name: name for name in sheets}
+        Config.SHEETS_BASE_URL = sheets_server.base_url
+        Config.CACHE_ENABLED = False
+        Config.RESPONSE_CACHE_ENABLED = False
+        Config.REFRESH_INTERVAL = 0
+        Config.LLM_BASE_URL = llm_server.base_url
+        Config.OPENROUTER_API_KEY = "stub"
+
+        print(f"\nstub LLM latency {args.latency}s")
+        port = free_port()
+        server = start_api(port)
+        try:
+            for concurrency in args.concurrency:
+                start = time.perf_counter()
+                runs = api_latencies(port, questions, concurrency)
+                summary(f"API, concurrency {concurrency}", runs, time.perf_counter() - start)
+        finally:
+            server.should_exit = True
+
+        try:
+            sample = questions[:args.streamlit_requests]
+            start = time.perf_counter()
+            runs = streamlit_latencies(sample)
+            summary("Streamlit script path", runs, time.perf_counter() - start)
+        except ImportError:
+            print("  Streamlit script path: streamlit not installed, skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark - Batch throughput: one-at-a-time answer() vs process_many against a local LLM stub
+
+Usage:
+    python -m benchmarks.bench_batch --questions 64 --latency 0.5 --concurrency 1 4 16
+"""
+
+import argparse
+import time
+
+from configure import Config
+from benchmarks.local_llm import LocalChatServer
+from benchmarks.local_sheets import LocalSheetsServer
+from benchmarks.synthetic import all_sheets
+from src.llm.chains import HFCAgent
+
+# Free-form questions the router leaves to the LLM
+TEMPLATES = [
+    "How much is the spicy zinger burger number {n}?",
+    "Is the chicken wrap {n} spicy?",
+    "Do you have vegetarian options for table {n}?",
+    "What comes with family meal {n}?",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.5, help="stub time per completion (s)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--duplicates", type=float, default=0.25, help="share of repeated questions")
+    args = parser.parse_args()
+
+    unique = max(1, int(args.questions * (1 - args.duplicates)))
+    questions = [TEMPLATES[i % len(TEMPLATES)].format(n=i % unique) for i in range(args.questions)]
+
+    sheets = all_sheets(200)
+    with LocalSheetsServer(sheets) as sheets_server, LocalChatServer(args.latency) as llm_server:
+        Config.SHEET_IDS = {name: name for name in sheets}
+        Config.SHEETS_BASE_URL = sheets_server.base_url
+        Config.CACHE_ENABLED = False
+        Config.RESPONSE_CACHE_ENABLED = False
+        Config.REFRESH_INTERVAL = 0
+        Config.LLM_BASE_URL = llm_server.base_url
+        Config.OPENROUTER_API_KEY = "stub"
+
+        agent = HFCAgent()
+
+        sample = questions[:min(8, len(questions))]
+        start = time.perf_counter()
+        for question in sample:
+            agent.answer(question)
+        sequential = len(sample) / (time.perf_counter() - start)
+        print(f"\n  {'answer() one at a time':28s} {sequential:7.1f} q/s")
+
+        for concurrency in args.concurrency:
+            calls_before = llm_server.requests
+            llm_server.peak_active = 0
+            start = time.perf_counter()
+            agent.process_many(questions, max_concurrency=concurrency)
+            rate = len(questions) / (time.perf_counter() - start)
+            print(f"  {f'process_many, concurrency {concurrency}':28s} {rate:7.1f} q/s  "
+                  f"x{rate / sequential:.1f}  ({llm_server.requests - calls_before} LLM calls, "
+                  f"peak {llm_server.peak_active} in flight)")
+
+
+if __name__ == "__main__":
+    main()
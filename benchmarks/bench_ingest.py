@@ -0,0 +1,64 @@
+"""
+Benchmark - Menu sheet ingest: iterrows vs vectorized pandas vs csv streaming
+
+Usage:
+    python -m benchmarks.bench_ingest --sizes 10000 100000
+"""
+
+import argparse
+import io
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import menu_csv
+from src.data.sheets_client import GoogleSheetsClient
+
+
+def legacy_menu(text: str):
+    """Original per-row / per-cell ingest"""
+    df = pd.read_csv(io.StringIO(text))
+    menu = []
+    columns = df.columns.tolist()
+    for _, row in df.iterrows():
+        item = {}
+        for col in columns:
+            value = row[col]
+            value = "" if pd.isna(value) else str(value).strip()
+            clean_col = col.strip().replace(" ", "_")
+            item[clean_col] = value
+        if item.get("Item_Name") or item.get("Item"):
+            menu.append(item)
+    return menu
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    client = GoogleSheetsClient()
+    for size in args.sizes:
+        text = menu_csv(size)
+        legacy = best_of(lambda: legacy_menu(text), 1 if size > 20_000 else args.repeat)
+        vectorized = best_of(lambda: client.parse_csv("menu", text, "pandas"), args.repeat)
+        streaming = best_of(lambda: client.parse_csv("menu", text, "csv"), args.repeat)
+
+        print(f"\n{size:,} rows")
+        print(f"  iterrows (legacy)   {legacy * 1000:9.1f} ms")
+        print(f"  pandas vectorized   {vectorized * 1000:9.1f} ms  x{legacy / vectorized:.1f}")
+        print(f"  csv streaming       {streaming * 1000:9.1f} ms  x{legacy / streaming:.1f}")
+
+
+if __name__ == "__main__":
+    main()
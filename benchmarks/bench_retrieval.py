@@ -0,0 +1,59 @@
+"""
+Benchmark - Prompt context size and build time: full dump vs query-aware retrieval
+
+Usage:
+    python -m benchmarks.bench_retrieval --sizes 100 1000 10000
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import all_sheets
+from src.data.models import RestaurantData
+from src.data.sheets_client import GoogleSheetsClient
+from src.llm.retrieval import ContextRetriever
+
+QUESTIONS = [
+    "Are you open now?",
+    "Where are you located?",
+    "What's on the menu?",
+    "How much is the spicy zinger burger?",
+    "Do you have any chiken wraps?",
+    "What's popular?",
+    "Show me your desserts",
+]
+
+
+def approx_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def timed(fn, repeat: int = 20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+
+    client = GoogleSheetsClient()
+    retriever = ContextRetriever()
+
+    for size in args.sizes:
+        raw = {name: client.parse_csv(name, text, "csv") for name, text in all_sheets(size).items()}
+        data = RestaurantData(raw).warm()
+        full, full_time = timed(data.to_context)
+
+        print(f"\n{size:,} menu items - full context ~{approx_tokens(full):,} tokens ({full_time * 1000:.2f} ms)")
+        for question in QUESTIONS:
+            ctx, ctx_time = timed(lambda: retriever.build_context(data, question))
+            saved = 1 - approx_tokens(ctx) / max(approx_tokens(full), 1)
+            print(f"  {question:40s} ~{approx_tokens(ctx):7,} tokens  saved {saved:6.1%}  {ctx_time * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
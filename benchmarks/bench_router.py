@@ -0,0 +1,81 @@
+"""
+Benchmark - Intent router latency and share of questions that skip the LLM
+
+Usage:
+    python -m benchmarks.bench_router --repeat 2000
+"""
+
+import argparse
+import statistics
+import time
+from collections import Counter
+
+from benchmarks.synthetic import all_sheets
+from src.data.models import RestaurantData
+from src.data.sheets_client import GoogleSheetsClient
+from src.llm.router import IntentRouter
+
+# Roughly the mix seen in the chat page: quick buttons plus free-form questions
+QUESTIONS = [
+    "What's on the menu?",
+    "Are you open now?",
+    "Where are you located?",
+    "What's popular?",
+    "What are your hours?",
+    "What time do you close today?",
+    "What's your phone number?",
+    "Can you recommend something?",
+    "Show me the menu categories",
+    "Where is your address?",
+    "How much is the spicy zinger burger?",
+    "Do you have vegetarian options on the menu?",
+    "Is the chicken spicy?",
+    "Are you open on friday?",
+    "What time do you close on Friday?",
+    "When do you open on Saturday?",
+    "Are you open tomorrow?",
+    "What are your weekend hours?",
+    "What do you recommend for kids under 5 with allergies?",
+    "Do you deliver to my area?",
+    "Is there parking nearby?",
+    "What comes with the family meal?",
+    "Do you have any chiken wraps?",
+    "hi",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--threshold", type=float, default=None)
+    args = parser.parse_args()
+
+    client = GoogleSheetsClient()
+    data = RestaurantData({name: client.parse_csv(name, text, "csv") for name, text in all_sheets(500).items()})
+    router = IntentRouter(args.threshold)
+
+    runs = []
+    for _ in range(args.repeat):
+        for question in QUESTIONS:
+            start = time.perf_counter()
+            router.route(question, data)
+            runs.append(time.perf_counter() - start)
+    runs.sort()
+
+    p50 = statistics.median(runs) * 1e6
+    p99 = runs[int(len(runs) * 0.99) - 1] * 1e6
+    print(f"route(): p50 {p50:.1f} us   p99 {p99:.1f} us   ({len(runs):,} calls)")
+
+    routed = Counter()
+    for question in QUESTIONS:
+        intent, confidence = router.classify(question)
+        answered = router.route(question, data) is not None
+        routed["router" if answered else "llm"] += 1
+        print(f"  {'ROUTER' if answered else 'llm   '} {confidence:4.2f} {intent or '-':10s} {question}")
+
+    share = routed["router"] / len(QUESTIONS)
+    print(f"skip LLM: {routed['router']}/{len(QUESTIONS)} questions ({share:.0%}) at threshold {router.threshold}")
+
+
+if __name__ == "__main__":
+    main()
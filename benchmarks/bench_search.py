@@ -0,0 +1,68 @@
+"""
+Benchmark - Menu search latency: linear substring scan vs inverted index
+
+Usage:
+    python -m benchmarks.bench_search --items 50000
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.synthetic import all_sheets
+from src.data.models import RestaurantData
+from src.data.sheets_client import GoogleSheetsClient
+
+QUERIES = ["chicken", "chiken", "burgr", "spicy zinger", "crisp", "peri peri wrap", "lemonade", "xyzzy"]
+
+
+def legacy_search(menu, query: str):
+    """Original linear scan, lower-casing both fields per item"""
+    query = query.lower()
+    return [
+        item for item in menu
+        if query in item.get("Item_Name", "").lower()
+        or query in item.get("Description", "").lower()
+    ]
+
+
+def latencies(fn, queries, repeat: int) -> list:
+    runs = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            fn(query)
+            runs.append(time.perf_counter() - start)
+    return sorted(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    client = GoogleSheetsClient()
+    raw = {name: client.parse_csv(name, text, "csv") for name, text in all_sheets(args.items).items()}
+    data = RestaurantData(raw)
+
+    start = time.perf_counter()
+    data.search_index
+    print(f"index build: {(time.perf_counter() - start) * 1000:.0f} ms for {args.items:,} items")
+
+    for name, fn in (
+        ("linear scan (legacy)", lambda q: legacy_search(raw["menu"], q)),
+        ("inverted index", lambda q: data.search_menu(q, limit=10)),
+    ):
+        runs = latencies(fn, QUERIES, args.repeat)
+        p50 = statistics.median(runs) * 1000
+        p99 = runs[int(len(runs) * 0.99) - 1] * 1000
+        print(f"  {name:22s} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+    for query in QUERIES:
+        top = [item.name for item in data.search_menu(query, limit=3)]
+        print(f"  {query!r:18} -> {top}")
+
+
+if __name__ == "__main__":
+    main()
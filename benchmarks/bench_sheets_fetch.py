@@ -0,0 +1,73 @@
+"""
+Benchmark - Sequential vs concurrent pooled sheet fetching
+
+Usage:
+    python -m benchmarks.bench_sheets_fetch --latency 0.15 --connect-latency 0.1
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+import pandas as pd
+
+from configure import Config
+from benchmarks.local_sheets import LocalSheetsServer
+from benchmarks.synthetic import all_sheets
+from src.data.cache import SheetCache
+from src.data.sheets_client import GoogleSheetsClient
+
+
+def legacy_fetch(base_url: str):
+    """Original behaviour: one pd.read_csv(url) per sheet, in a row"""
+    return {name: pd.read_csv(base_url.format(sheet_id=name)) for name in Config.SHEET_IDS}
+
+
+def timed(fn, repeat: int) -> list:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.15, help="per-request delay (s)")
+    parser.add_argument("--connect-latency", type=float, default=0.1, help="per-connection delay (s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sheets = all_sheets(args.items)
+    with LocalSheetsServer(sheets, args.latency, args.connect_latency) as server:
+        Config.SHEET_IDS = {name: name for name in sheets}
+        Config.SHEETS_BASE_URL = server.base_url
+        Config.CACHE_ENABLED = False
+
+        client = GoogleSheetsClient()
+        results = {
+            "legacy (read_csv, sequential)": timed(lambda: legacy_fetch(server.base_url), args.repeat),
+            "pooled, sequential": timed(lambda: client.get_all_data(concurrent=False), args.repeat),
+            "pooled, concurrent": timed(lambda: client.get_all_data(concurrent=True), args.repeat),
+        }
+
+        # Forced refresh against a warm cache: server answers 304, nothing is parsed
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached = GoogleSheetsClient(cache=SheetCache(cache_dir))
+            cached.get_all_data()
+            results["concurrent, conditional (304)"] = timed(
+                lambda: cached.get_all_data(force_refresh=True), args.repeat
+            )
+
+    baseline = statistics.median(results["legacy (read_csv, sequential)"])
+    print(f"\nlatency={args.latency}s connect={args.connect_latency}s items={args.items}")
+    for name, runs in results.items():
+        median = statistics.median(runs)
+        print(f"  {name:32s} median {median * 1000:7.1f} ms  speedup x{baseline / median:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark - Full data load: CSV over HTTP vs local CSV directory vs Parquet / Arrow snapshot
+
+Usage:
+    python -m benchmarks.bench_sources --sizes 1000 100000 --latency 0.15
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from configure import Config
+from benchmarks.local_sheets import LocalSheetsServer
+from benchmarks.synthetic import all_sheets
+from src.data.sheets_client import GoogleSheetsClient
+from src.data.sources import LocalCSVSource, ParquetSource
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fresh_load(make_source):
+    """Load with a new source object, so nothing parsed is reused"""
+    return lambda: make_source().get_all_data()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--latency", type=float, default=0.15, help="per-request delay of the HTTP path (s)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    Config.CACHE_ENABLED = False
+    for size in args.sizes:
+        sheets = all_sheets(size)
+        print(f"\n{size:,} menu items")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            for name, text in sheets.items():
+                (directory / f"{name}.csv").write_text(text, encoding="utf-8")
+
+            with LocalSheetsServer(sheets, latency=args.latency) as server:
+                Config.SHEET_IDS = {name: name for name in sheets}
+                Config.SHEETS_BASE_URL = server.base_url
+                http = best_of(fresh_load(GoogleSheetsClient), args.repeat)
+            timings = {"CSV over HTTP": http, "local CSV": best_of(fresh_load(lambda: LocalCSVSource(directory)), args.repeat)}
+
+            if pyarrow is not None:
+                data = LocalCSVSource(directory).get_all_data()
+                for fmt in ParquetSource.FORMATS:
+                    ParquetSource(directory, fmt).write(data)
+                    assert ParquetSource(directory, fmt).get_all_data() == data
+                    timings[f"local {fmt}"] = best_of(fresh_load(lambda f=fmt: ParquetSource(directory, f)), args.repeat)
+
+                # Refresher case: files re-read and hashed, unchanged sheets not parsed again
+                source = ParquetSource(directory)
+                source.get_all_data()
+                timings["parquet, unchanged"] = best_of(lambda: source.get_all_data(force_refresh=True), args.repeat)
+            else:
+                print("  pyarrow not installed: Parquet / Arrow skipped")
+
+        for name, seconds in timings.items():
+            print(f"  {name:20s} {seconds * 1000:9.1f} ms  x{http / seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark - Cold start: import time per module, time to first paint and to first answer
+
+Each measurement runs in a fresh interpreter. "eager" pre-imports the LLM and
+data stack before the page runs (the old module-level imports); "lazy" builds
+the agent on the first question; "preload" builds it in the background while
+the welcome screen renders. Data comes from a local CSV directory and the LLM
+is off, so only startup work is measured.
+
+Usage:
+    python -m benchmarks.bench_startup --think 3 --top 15
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from configure import Config
+from benchmarks.synthetic import all_sheets
+
+HEAVY_MODULES = ["src.llm.chains", "langchain_openai", "pandas"]
+_IMPORT_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(module: str) -> list:
+    """(cumulative µs, self µs, module) of every module `import module` loads"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Config.BASE_DIR, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_RE.match(line)
+        if match:
+            rows.append((int(match.group(2)), int(match.group(1)), match.group(4)))
+    return rows
+
+
+def report_imports(module: str, top: int):
+    rows = import_times(module)
+    total = next(cumulative for cumulative, _, name in rows if name == module)
+    print(f"\nimport {module}: {total / 1000:.0f} ms")
+    # Top-level packages and project modules, heaviest first
+    shown = [r for r in rows if "." not in r[2] or r[2].split(".")[0] in ("src", "ui")]
+    for cumulative, own, name in sorted(shown, reverse=True)[:top]:
+        print(f"  {name:40s} {cumulative / 1000:8.1f} ms  (self {own / 1000:.1f} ms)")
+
+
+def child(mode: str, think: float):
+    """Runs in a fresh interpreter: first paint, then the first question"""
+    start = time.perf_counter()
+    if mode == "eager":
+        for module in HEAVY_MODULES:
+            __import__(module)
+
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(Config.BASE_DIR / "main.py"), default_timeout=120)
+    app.run()
+    first_paint = time.perf_counter() - start
+
+    time.sleep(think)  # user reads the page and types
+    asked = time.perf_counter()
+    next(b for b in app.button if b.label == "Are you open now?").click().run()
+    if app.session_state["waiting_response"]:
+        app.run()
+    first_answer = time.perf_counter() - asked
+    print(json.dumps({"first_paint": first_paint, "first_answer": first_answer}))
+
+
+def run_child(mode: str, think: float, data_dir: str) -> dict:
+    env = dict(
+        os.environ,
+        DATA_SOURCE="csv",
+        DATA_SOURCE_DIR=data_dir,
+        OPENROUTER_API_KEY="",
+        REFRESH_INTERVAL="0",
+        AGENT_PRELOAD="true" if mode == "preload" else "false",
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child", mode, "--think", str(think)],
+        cwd=Config.BASE_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000)
+    parser.add_argument("--think", type=float, default=3.0, help="seconds between first paint and first question")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.think)
+        return
+
+    report_imports("ui.pages.chat", args.top)
+    report_imports("src.llm.chains", args.top)
+
+    print(f"\n{'mode':10s} {'first paint':>12s} {'first answer':>13s}   ({args.think:.0f}s to type)")
+    with tempfile.TemporaryDirectory() as data_dir:
+        for name, text in all_sheets(args.items).items():
+            with open(os.path.join(data_dir, f"{name}.csv"), "w", encoding="utf-8") as f:
+                f.write(text)
+        for mode in ("eager", "lazy", "preload"):
+            stats = run_child(mode, args.think, data_dir)
+            print(f"{mode:10s} {stats['first_paint'] * 1000:10.0f}ms {stats['first_answer'] * 1000:11.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
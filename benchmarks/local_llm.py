@@ -0,0 +1,124 @@
+"""
+Local LLM Stand-in - OpenAI-compatible chat completions endpoint with injected latency
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LocalChatServer:
+    """Serve /v1/chat/completions on localhost; replies echo the question"""
+
+    def __init__(self, latency: float = 0.5, tokens: int = 40, token_latency: float = 0.0):
+        self.latency = latency  # time to first token
+        self.tokens = tokens  # words per reply
+        self.token_latency = token_latency  # per streamed word
+        self.requests = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def reply(self, messages) -> str:
+        question = messages[-1].get("content", "") if messages else ""
+        question = question.rsplit("My Question:", 1)[-1].split("\n", 1)[0].strip()
+        words = [f"word{i}" for i in range(self.tokens)]
+        return f"Answer to '{question}': " + " ".join(words)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                with server._lock:
+                    server.requests += 1
+                    server.active += 1
+                    server.peak_active = max(server.peak_active, server.active)
+                try:
+                    text = server.reply(body.get("messages", []))
+                    if body.get("stream"):
+                        self._stream(body, text)
+                    else:
+                        time.sleep(server.latency)
+                        self._complete(body, text)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def _complete(self, body, text):
+                payload = json.dumps({
+                    "id": f"stub-{server.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": server.tokens, "total_tokens": server.tokens}
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, body, text):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.flush()
+                # Like hosted APIs: headers at once, then the wait for the first token
+                time.sleep(server.latency)
+                for i, word in enumerate(text.split(" ")):
+                    chunk = {
+                        "id": f"stub-{server.requests}",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": body.get("model", "stub"),
+                        "choices": [{"index": 0, "delta": {"content": word if i == 0 else " " + word},
+                                     "finish_reason": None}]
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                    time.sleep(server.token_latency)
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "LocalChatServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,98 @@
+"""
+Local Google Sheets Stand-in - Serve CSV sheets over HTTP with injected latency
+"""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+
+class LocalSheetsServer:
+    """Serve {sheet_id: csv_text} at the gviz export path on localhost"""
+
+    def __init__(self, sheets: Dict[str, str], latency: float = 0.0, connect_latency: float = 0.0,
+                 etags: bool = True):
+        self.sheets = sheets
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.etags = etags
+        self.requests = 0
+        self.not_modified = 0
+        self.connections = 0
+        self._server = None
+        self._thread = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                # Stand-in for DNS + TCP + TLS handshake cost
+                server.connections += 1
+                time.sleep(server.connect_latency)
+                super().setup()
+
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(server.latency)
+
+                # /spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv
+                parts = self.path.split("/")
+                sheet_id = parts[3] if len(parts) > 3 else ""
+                body = server.sheets.get(sheet_id)
+
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                payload = body.encode("utf-8")
+                etag = '"%s"' % hashlib.md5(payload).hexdigest()
+
+                if server.etags and self.headers.get("If-None-Match") == etag:
+                    server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                if server.etags:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/spreadsheets/d/{{sheet_id}}/gviz/tq?tqx=out:csv"
+
+    def start(self) -> "LocalSheetsServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
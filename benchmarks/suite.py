@@ -0,0 +1,171 @@
+"""
+Benchmark Suite - Every hot path at several menu sizes, saved as JSON
+
+Synthetic sheets are served from localhost and the LLM is a deterministic fake
+chat model, so runs are reproducible and need no network or API key.
+
+Usage:
+    python -m benchmarks.suite --sizes 100 1000 10000 100000 --output bench.json
+    python -m benchmarks.suite --output new.json --compare bench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.output_parsers import StrOutputParser
+
+from configure import Config
+from benchmarks.local_sheets import LocalSheetsServer
+from benchmarks.synthetic import all_sheets
+from src.data.models import RestaurantData
+from src.data.sheets_client import GoogleSheetsClient
+from src.llm.chains import HFCAgent
+from src.llm.prompts import HFCPrompts
+
+SEARCH_QUERIES = ["chicken", "chiken", "spicy zinger", "peri peri wrap", "xyzzy"]
+LLM_QUESTIONS = ["How much is the spicy zinger burger?", "Is the chicken wrap spicy?", "Do you have vegetarian options?"]
+FALLBACK_QUESTIONS = {
+    "hours": "Are you open now?",
+    "location": "Where are you located?",
+    "menu": "What's on the menu?",
+    "recommend": "What do you recommend?",
+    "default": "hello there",
+}
+
+# Below this, differences are timer noise rather than regressions
+NOISE_FLOOR_MS = 0.05
+
+
+def measure(fn: Callable, repeat: int, budget: float = 2.0) -> Dict:
+    """Median / p95 / min over up to `repeat` runs (stops early after `budget` seconds)"""
+    runs: List[float] = []
+    deadline = time.perf_counter() + budget
+    while len(runs) < repeat and (len(runs) < 3 or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    runs.sort()
+    return {
+        "median_ms": statistics.median(runs),
+        "p95_ms": runs[min(len(runs) - 1, int(len(runs) * 0.95))],
+        "min_ms": runs[0],
+        "runs": len(runs),
+    }
+
+
+def fake_agent() -> HFCAgent:
+    """HFCAgent with a deterministic fake chat model (sheets must be served)"""
+    Config.OPENROUTER_API_KEY = None  # no real LLM
+    Config.REFRESH_INTERVAL = 0
+    Config.RESPONSE_CACHE_ENABLED = False  # every process_query reaches the model
+    agent = HFCAgent()
+    fake = FakeListChatModel(responses=["Our spicy zinger burger is $7.99 and comes with fries. 100% Halal ☪️"])
+    agent.chain = HFCPrompts.get_chat_prompt() | fake | StrOutputParser()
+    return agent
+
+
+def run_size(size: int, repeat: int) -> Dict[str, Dict]:
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, fn: Callable, times: int = repeat):
+        results[f"{name}[{size}]"] = stats = measure(fn, times)
+        print(f"  {name:32s} median {stats['median_ms']:10.3f} ms  p95 {stats['p95_ms']:10.3f} ms  ({stats['runs']} runs)")
+
+    print(f"\n{size:,} menu items")
+    sheets = all_sheets(size)
+
+    with LocalSheetsServer(sheets) as server:
+        Config.SHEET_IDS = {name: name for name in sheets}
+        Config.SHEETS_BASE_URL = server.base_url
+        Config.CACHE_ENABLED = False
+        client = GoogleSheetsClient(cache=None)
+        record("get_all_data", client.get_all_data, max(3, repeat // 10))
+        raw = client.get_all_data()
+        agent = fake_agent()
+
+    record("RestaurantData()", lambda: RestaurantData(raw), max(3, repeat // 10))
+    data = RestaurantData(raw)
+    record("warm()", lambda: RestaurantData(raw).warm(), max(3, repeat // 10))
+    data.warm()
+
+    # Menu and indexes reused, context segments rebuilt: first call on a new snapshot
+    without_context = {k: v for k, v in data._derived.items() if not k.startswith("context_")}
+    record("to_context (first)", lambda: RestaurantData(raw, derived=without_context).to_context())
+    record("to_context (cached)", data.to_context)
+    record("search_menu", lambda: [data.search_menu(q, 10) for q in SEARCH_QUERIES])
+    record("is_open_now", data.is_open_now)
+
+    agent.data = data
+    record("process_query (fake LLM)", lambda: [agent.process_query(q) for q in LLM_QUESTIONS])
+    for intent, question in FALLBACK_QUESTIONS.items():
+        record(f"_fallback_response ({intent})", lambda q=question: agent._fallback_response(q, data))
+    agent.stop_refresher()
+
+    return results
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Names of benchmarks whose median regressed by more than `threshold`"""
+    regressions = []
+    print(f"\n{'benchmark':48s} {'baseline':>12s} {'current':>12s} {'change':>9s}")
+    for name, stats in current.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:48s} {'-':>12s} {stats['median_ms']:10.3f}ms {'new':>9s}")
+            continue
+        before, after = old["median_ms"], stats["median_ms"]
+        change = (after - before) / before if before else 0.0
+        regressed = change > threshold and after - before > NOISE_FLOOR_MS
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:48s} {before:10.3f}ms {after:10.3f}ms {change:+8.1%}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed median slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict] = {}
+    for size in args.sizes:
+        results.update(run_size(size, args.repeat))
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
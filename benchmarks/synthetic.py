@@ -0,0 +1,87 @@
+"""
+Synthetic Sheets - Deterministic restaurant CSVs for benchmarks
+"""
+
+import csv
+import io
+import random
+from typing import Dict, List
+
+CATEGORIES = ["Fried Chicken", "Burgers", "Wraps", "Sides", "Drinks", "Desserts", "Deals", "Kids Meals"]
+WORDS = [
+    "crispy", "spicy", "zinger", "classic", "grilled", "cheesy", "smoky", "garlic",
+    "tender", "golden", "double", "mighty", "original", "peri", "honey", "bbq",
+    "chicken", "burger", "wings", "strips", "fries", "wrap", "shake", "nuggets",
+    "coleslaw", "sauce", "mayo", "bun", "lettuce", "pepper", "lemonade", "sundae"
+]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def _to_csv(rows: List[List[str]]) -> str:
+    out = io.StringIO()
+    csv.writer(out).writerows(rows)
+    return out.getvalue()
+
+
+def restaurant_info_csv() -> str:
+    return _to_csv([
+        ["Field", "Value"],
+        ["Name", "HFC - Halal Fried Chicken"],
+        ["Address", "12 Market Street"],
+        ["Phone", "+1 555 0100"],
+        ["Rating", "4.6"],
+    ])
+
+
+def timings_csv() -> str:
+    rows = [["Day", "Opens", "Closes", "Status"]]
+    for day in DAYS:
+        rows.append([day, "11:00 AM", "11:00 PM", "Open"])
+    rows.append(["Meal_Type", "Start_Time", "End_Time", ""])
+    rows.append(["Lunch", "12:00 PM", "3:00 PM", ""])
+    rows.append(["Dinner", "7:00 PM", "10:00 PM", ""])
+    return _to_csv(rows)
+
+
+def menu_rows(n_items: int, seed: int = 42) -> List[List[str]]:
+    rng = random.Random(seed)
+    rows = [["Item_ID", "Item_Name", "Category", "Description", "Regular_Price",
+             "Available", "Is_Bestseller", "Is_Spicy"]]
+    for i in range(n_items):
+        name = " ".join(rng.sample(WORDS, 3)).title()
+        rows.append([
+            str(i + 1),
+            f"{name} {i + 1}",
+            CATEGORIES[i % len(CATEGORIES)],
+            " ".join(rng.choices(WORDS, k=8)),
+            f"{rng.uniform(1, 25):.2f}",
+            "Yes" if rng.random() < 0.9 else "No",
+            "Yes" if rng.random() < 0.05 else "No",
+            "Yes" if rng.random() < 0.2 else "No",
+        ])
+    return rows
+
+
+def menu_csv(n_items: int, seed: int = 42) -> str:
+    return _to_csv(menu_rows(n_items, seed))
+
+
+def extras_csv() -> str:
+    return _to_csv([
+        ["Category", "Feature", "Available"],
+        ["Service", "Dine-in", "Yes"],
+        ["Service", "Takeaway", "Yes"],
+        ["Service", "Delivery", "Yes"],
+        ["Facility", "Free WiFi", "Yes"],
+        ["Facility", "Parking", "No"],
+    ])
+
+
+def all_sheets(n_items: int = 100, seed: int = 42) -> Dict[str, str]:
+    """{sheet_name: csv_text} for all four sheets"""
+    return {
+        "restaurant_info": restaurant_info_csv(),
+        "timings": timings_csv(),
+        "menu": menu_csv(n_items, seed),
+        "extras": extras_csv(),
+    }
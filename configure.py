@@ -29,18 +29,93 @@ class Config:
         "extras": os.getenv("SHEET_ID_EXTRAS")
     }
     
+    # Google Sheets Fetching
+    SHEETS_BASE_URL = os.getenv(
+        "SHEETS_BASE_URL",
+        "https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv"
+    )
+    SHEETS_CONCURRENT = os.getenv("SHEETS_CONCURRENT", "true").lower() == "true"
+    SHEETS_CONNECT_TIMEOUT = float(os.getenv("SHEETS_CONNECT_TIMEOUT", "3.05"))
+    SHEETS_READ_TIMEOUT = float(os.getenv("SHEETS_READ_TIMEOUT", "10"))
+    SHEETS_READ_TIMEOUTS = {"menu": 20.0}  # Per-sheet overrides
+    SHEETS_POOL_SIZE = 4
+    SHEETS_PARSER = os.getenv("SHEETS_PARSER", "pandas")  # "pandas" or "csv"
+    
+    # Data Source: "sheets", or a local directory of "csv" / "parquet" / "arrow" files (pyarrow)
+    DATA_SOURCE = os.getenv("DATA_SOURCE", "sheets")
+    DATA_SOURCE_DIR = Path(os.getenv("DATA_SOURCE_DIR", str(DATA_DIR / "sheets")))
+    
     # LLM API Keys (from .env)
     OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
     HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY")
     
-    # LLM Settings - Using OpenRouter
-    LLM_MODEL = "tngtech/deepseek-r1t2-chimera:free"
+    # LLM Settings - Using OpenRouter (any OpenAI-compatible endpoint works)
+    LLM_BASE_URL = os.getenv("LLM_BASE_URL", "https://openrouter.ai/api/v1")
+    LLM_MODEL = os.getenv("LLM_MODEL", "tngtech/deepseek-r1t2-chimera:free")
     LLM_TEMPERATURE = 0.7
     LLM_MAX_TOKENS = 512
+    LLM_MAX_INPUT_TOKENS = int(os.getenv("LLM_MAX_INPUT_TOKENS", "6000"))  # prompt budget
+    TOKENIZER_ENCODING = "cl100k_base"
+    # Ordered fallbacks for hedging: "primary,secondary,..." (one model = no hedging)
+    LLM_MODELS = [m.strip() for m in os.getenv("LLM_MODELS", LLM_MODEL).split(",") if m.strip()]
+    BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))  # process_many parallel LLM calls
+    
+    # LLM client: timeouts, connection pool, retries
+    LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "3.05"))
+    LLM_READ_TIMEOUT = float(os.getenv("LLM_READ_TIMEOUT", "20"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))  # transient errors only, jittered backoff
+    LLM_POOL_SIZE = 16
+    
+    # Hedged requests: start the next model when the first token is later than this percentile
+    HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.9"))
+    HEDGE_MIN_DELAY_MS = 500
+    HEDGE_INITIAL_DELAY_MS = 4000  # until enough latencies are observed
+    
+    # Circuit breaker: after N failed/slow calls, use the fallback for a cooldown
+    LLM_BREAKER_FAILURES = 3
+    LLM_SLOW_CALL_MS = 15000
+    LLM_BREAKER_COOLDOWN = float(os.getenv("LLM_BREAKER_COOLDOWN", "30"))
+    
+    # Prompt layout: "inline" sends retrieved, budget-trimmed context with each question;
+    # "prefix" sends all static data as a stable system-message prefix - only worth it
+    # when the provider caches prompt prefixes, as it is several times more input tokens
+    PROMPT_LAYOUT = os.getenv("PROMPT_LAYOUT", "inline")
+    
+    # Conversation memory per chat: recent turns verbatim, older ones summarized
+    MEMORY_MAX_TOKENS = int(os.getenv("MEMORY_MAX_TOKENS", "800"))
+    MEMORY_SUMMARY_MAX_TOKENS = 200
+    
+    # Context Retrieval (send only relevant menu slices)
+    RETRIEVAL_ENABLED = os.getenv("RETRIEVAL_ENABLED", "true").lower() == "true"
+    RETRIEVAL_MAX_ITEMS = 25
+    RETRIEVAL_MAX_CATEGORY_ITEMS = 40
+    
+    # HTTP API (api.py)
+    API_HOST = os.getenv("API_HOST", "0.0.0.0")
+    API_PORT = int(os.getenv("API_PORT", "8000"))
+    API_WORKERS = int(os.getenv("API_WORKERS", "1"))  # processes; each has its own agent
+    API_MAX_CONVERSATIONS = 10_000  # conversation memories kept per worker
     
     # Cache
     CACHE_ENABLED = True
     CACHE_TTL = 300  # 5 minutes
+    
+    # Intent router: structured questions answered without the LLM (0..1, >1 = off)
+    ROUTER_THRESHOLD = float(os.getenv("ROUTER_THRESHOLD", "0.6"))
+    ROUTER_FOLLOWUP_THRESHOLD = 0.95  # with conversation history: "is it popular?" needs the LLM
+    
+    # LLM response cache (memory LRU + optional SQLite shared by workers)
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_SIZE = 512
+    RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "600"))
+    RESPONSE_CACHE_DB = os.getenv("RESPONSE_CACHE_DB", str(CACHE_DIR / "responses.sqlite3"))  # "" = memory only
+    
+    # Streamlit: build the agent in the background while the first page renders
+    # (false = build it when the first question is asked)
+    AGENT_PRELOAD = os.getenv("AGENT_PRELOAD", "true").lower() == "true"
+    
+    # Background data refresh (seconds, 0 = off)
+    REFRESH_INTERVAL = float(os.getenv("REFRESH_INTERVAL", "300"))
 
 
 class Colors:
@@ -32,6 +32,7 @@ def render_sidebar():
         # New Chat Button
         if st.button("☪️ Halal Certified", key="new_chat", use_container_width=True):
             st.session_state.messages = []
+            st.session_state.pop("memory", None)
             st.session_state.show_welcome = True
             st.rerun()
         
@@ -0,0 +1,70 @@
+"""
+Sheet Cache - On-disk TTL cache for parsed sheet data
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from configure import Config
+
+
+class SheetCache:
+    """One JSON file per sheet under Config.CACHE_DIR"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: Optional[float] = None):
+        self.cache_dir = Path(cache_dir or Config.CACHE_DIR)
+        self.ttl = Config.CACHE_TTL if ttl is None else ttl
+
+    def _path(self, sheet_name: str) -> Path:
+        return self.cache_dir / f"{sheet_name}.json"
+
+    def load(self, sheet_name: str) -> Optional[Dict]:
+        """Load cache entry ({"fetched_at", "data", ...}) or None"""
+        path = self._path(sheet_name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            touched_at = os.stat(path).st_mtime
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None
+
+        # touch() bumps mtime instead of rewriting the file
+        entry["fetched_at"] = max(entry.get("fetched_at", 0), touched_at)
+        return entry
+
+    def save(self, sheet_name: str, data: Any, **meta) -> Dict:
+        """Write entry atomically (temp file + rename)"""
+        entry = {"fetched_at": time.time(), **meta, "data": data}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{sheet_name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path(sheet_name))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return entry
+
+    def touch(self, sheet_name: str, entry: Dict) -> Dict:
+        """Restart TTL of an unchanged entry without rewriting it"""
+        os.utime(self._path(sheet_name))
+        entry["fetched_at"] = time.time()
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Entry younger than TTL"""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
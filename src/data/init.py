@@ -3,6 +3,12 @@ HFC Data Module
 """
 
 from src.data.sheets_client import GoogleSheetsClient
-from src.data.models import RestaurantData
+from src.data.models import MenuItem, RestaurantData
+from src.data.cache import SheetCache
+from src.data.search import MenuSearchIndex
+from src.data.sources import DataSource, LocalCSVSource, ParquetSource, create_source
 
-__all__ = ["GoogleSheetsClient", "RestaurantData"]
\ No newline at end of file
+__all__ = [
+    "DataSource", "GoogleSheetsClient", "LocalCSVSource", "MenuItem", "MenuSearchIndex",
+    "ParquetSource", "RestaurantData", "SheetCache", "create_source"
+]
\ No newline at end of file
@@ -2,19 +2,169 @@
 Data Models - Format data for LLM context
 """
 
+import hashlib
+import json
+import sys
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from src.data.search import MenuSearchIndex
+
+
+def _is_yes(value: str) -> bool:
+    return value.strip().lower() == "yes"
+
+
+def _to_price(value: str) -> Optional[float]:
+    """Parse "$4.99" / "1,250" style prices, None if not a number"""
+    cleaned = value.replace("$", "").replace(",", "").strip()
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+class MenuItem:
+    """Menu row parsed once at ingest: typed fields, no per-call string work"""
+    
+    __slots__ = (
+        "name", "category", "description", "price", "price_text",
+        "available", "bestseller", "spicy", "extra"
+    )
+    
+    # Sheet columns mapped onto typed attributes
+    COLUMNS = ("Item_Name", "Item", "Category", "Description", "Regular_Price", "Price",
+               "Available", "Is_Bestseller", "Is_Spicy")
+    
+    def __init__(self, row: Dict[str, str]):
+        self.name = row.get("Item_Name") or row.get("Item", "")
+        self.category = sys.intern(row.get("Category", ""))
+        self.description = row.get("Description", "")
+        self.price_text = row.get("Regular_Price", row.get("Price", ""))
+        self.price = _to_price(self.price_text)
+        self.available = _is_yes(row.get("Available", ""))
+        self.bestseller = _is_yes(row.get("Is_Bestseller", ""))
+        self.spicy = _is_yes(row.get("Is_Spicy", ""))
+        
+        # Any other sheet columns (Item_ID, Calories, ...), None when there are none
+        extra = {k: v for k, v in row.items() if k not in self.COLUMNS}
+        self.extra = extra or None
+    
+    def get(self, key: str, default: Any = "") -> Any:
+        """Dict-style access by sheet column name"""
+        if key in ("Item_Name", "Item"):
+            return self.name
+        if key == "Category":
+            return self.category
+        if key == "Description":
+            return self.description
+        if key in ("Regular_Price", "Price"):
+            return self.price_text
+        if key == "Available":
+            return "Yes" if self.available else "No"
+        if key == "Is_Bestseller":
+            return "Yes" if self.bestseller else "No"
+        if key == "Is_Spicy":
+            return "Yes" if self.spicy else "No"
+        return self.extra.get(key, default) if self.extra else default
+    
+    def context_line(self, description: bool = False) -> str:
+        """Menu line as shown in the LLM context"""
+        avail = "✅" if self.available else "❌"
+        best = "⭐" if self.bestseller else ""
+        spicy = "🌶️" if self.spicy else ""
+        line = f"  • {self.name} - ${self.price_text} {best}{spicy} {avail}\n"
+        if description and self.description:
+            line += f"      {self.description}\n"
+        return line
+    
+    def __repr__(self) -> str:
+        return f"MenuItem({self.name!r}, {self.category!r}, {self.price_text!r})"
 
 
 class RestaurantData:
-    """Restaurant data processor"""
+    """Restaurant data processor (treated as an immutable snapshot)"""
+    
+    SECTIONS = ("restaurant_info", "timings", "menu", "extras")
     
-    def __init__(self, data: Dict):
+    def __init__(
+        self,
+        data: Dict,
+        version: int = 1,
+        section_versions: Optional[Dict[str, int]] = None,
+        derived: Optional[Dict[str, Tuple[Tuple[str, ...], Any]]] = None
+    ):
         self.raw = data
         self.info = data.get("restaurant_info", {})
         self.timings = data.get("timings", {})
-        self.menu = data.get("menu", [])
         self.extras = data.get("extras", [])
+        
+        # Version bumps whenever any section changes; downstream caches key on it
+        self.version = version
+        self.section_versions = section_versions or {s: version for s in self.SECTIONS}
+        self.changed_sections: Tuple[str, ...] = self.SECTIONS
+        self._derived = dict(derived or {})
+        self._context_cache: Optional[Tuple[str, str]] = None
+        
+        self.menu: List[MenuItem] = self._derive(
+            "menu_items", ("menu",), lambda: [MenuItem(row) for row in data.get("menu", [])]
+        )
+    
+    def _derive(self, key: str, sections: Tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """Memoize state derived from the given sections (kept across updates while they are unchanged)"""
+        entry = self._derived.get(key)
+        if entry is None:
+            entry = (sections, build())
+            self._derived[key] = entry
+        return entry[1]
+    
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of all sections; stable across processes (unlike version)"""
+        digests = [
+            self._derive(f"hash_{s}", (s,), lambda s=s: hashlib.sha256(
+                json.dumps(self.raw.get(s), sort_keys=True, ensure_ascii=False).encode("utf-8")
+            ).hexdigest())
+            for s in self.SECTIONS
+        ]
+        return hashlib.sha256("|".join(digests).encode("utf-8")).hexdigest()[:16]
+    
+    def warm(self) -> "RestaurantData":
+        """Build derived state up front (before the snapshot is published)"""
+        self.menu_index
+        self.search_index
+        self.fingerprint
+        for name in self.SEGMENT_SECTIONS:
+            self.context_segment(name)
+        self.static_context()
+        return self
+    
+    def updated(self, data: Dict, changed: Optional[Iterable[str]] = None) -> "RestaurantData":
+        """New snapshot rebuilding only changed sections; returns self if nothing changed"""
+        candidates = self.SECTIONS if changed is None else tuple(changed)
+        changed_sections = tuple(
+            s for s in self.SECTIONS
+            if s in candidates and s in data
+            and data[s] is not self.raw.get(s) and data[s] != self.raw.get(s)
+        )
+        
+        if not changed_sections:
+            return self
+        
+        version = self.version + 1
+        merged = dict(self.raw)
+        section_versions = dict(self.section_versions)
+        for s in changed_sections:
+            merged[s] = data[s]
+            section_versions[s] = version
+        
+        derived = {
+            key: entry for key, entry in self._derived.items()
+            if not set(entry[0]) & set(changed_sections)
+        }
+        
+        snapshot = RestaurantData(merged, version, section_versions, derived)
+        snapshot.changed_sections = changed_sections
+        return snapshot
     
     def is_open_now(self) -> Dict:
         """Check if currently open"""
@@ -34,43 +184,70 @@ class RestaurantData:
         
         return {"is_open": False, "day": day, "time": time}
     
+    @property
+    def menu_index(self) -> Dict:
+        """Lookup indexes over the menu, built once per menu version"""
+        return self._derive("menu_index", ("menu",), self._build_menu_index)
+    
+    def _build_menu_index(self) -> Dict:
+        grouped: Dict[str, List[MenuItem]] = {}
+        by_category: Dict[str, List[MenuItem]] = {}
+        bestsellers, available = [], []
+        
+        for item in self.menu:
+            grouped.setdefault(item.category or "Other", []).append(item)
+            by_category.setdefault(item.category.lower(), []).append(item)
+            if item.bestseller:
+                bestsellers.append(item)
+            if item.available:
+                available.append(item)
+        
+        return {
+            "grouped": grouped,  # display category -> items, in sheet order
+            "by_category": by_category,  # lower-case category -> items
+            "categories": sorted({item.category for item in self.menu if item.category}),
+            "bestsellers": bestsellers,
+            "available": available,
+            "positions": {id(item): i for i, item in enumerate(self.menu)}  # sheet order
+        }
+    
     def get_categories(self) -> List[str]:
         """Get menu categories"""
-        cats = set()
-        for item in self.menu:
-            cat = item.get("Category", "")
-            if cat:
-                cats.add(cat)
-        return sorted(list(cats))
+        return list(self.menu_index["categories"])
     
-    def get_menu_by_category(self, category: str) -> List[Dict]:
+    def get_menu_by_category(self, category: str) -> List[MenuItem]:
         """Filter menu by category"""
-        return [
-            item for item in self.menu
-            if item.get("Category", "").lower() == category.lower()
-        ]
+        return list(self.menu_index["by_category"].get(category.lower(), []))
     
-    def get_bestsellers(self) -> List[Dict]:
+    def get_bestsellers(self) -> List[MenuItem]:
         """Get bestseller items"""
-        return [
-            item for item in self.menu
-            if item.get("Is_Bestseller", "").lower() == "yes"
-        ]
+        return list(self.menu_index["bestsellers"])
     
-    def search_menu(self, query: str) -> List[Dict]:
-        """Search menu"""
-        query = query.lower()
-        return [
-            item for item in self.menu
-            if query in item.get("Item_Name", "").lower()
-            or query in item.get("Description", "").lower()
-        ]
+    def get_available_items(self) -> List[MenuItem]:
+        """Get items currently available"""
+        return list(self.menu_index["available"])
     
-    def to_context(self) -> str:
-        """Format as LLM context"""
-        status = self.is_open_now()
-        
-        ctx = f"""
+    @property
+    def search_index(self) -> MenuSearchIndex:
+        """Full-text index over the menu, built once per menu version"""
+        return self._derive("search_index", ("menu",), lambda: MenuSearchIndex(self.menu))
+    
+    def search_menu(self, query: str, limit: int = 20) -> List[MenuItem]:
+        """Search menu (ranked, typo tolerant)"""
+        return [item for item, _ in self.search_index.search(query, limit)]
+    
+    # Context segments, in prompt order. Only "status" depends on the clock.
+    CONTEXT_SEGMENTS = ("info", "status", "weekly_hours", "meals", "menu", "facilities")
+    SEGMENT_SECTIONS = {
+        "info": ("restaurant_info",),
+        "weekly_hours": ("timings",),
+        "meals": ("timings",),
+        "menu": ("menu",),
+        "facilities": ("extras",)
+    }
+    
+    def _segment_info(self) -> str:
+        return f"""
 === HFC - HALAL FRIED CHICKEN ===
 
 📍 RESTAURANT INFO:
@@ -80,45 +257,79 @@ Phone: {self.info.get('Phone', 'N/A')}
 Rating: {self.info.get('Rating', 'N/A')} ⭐
 Halal Certified: Yes ☪️
 
-🕐 CURRENT STATUS:
+"""
+    
+    def _segment_status(self) -> str:
+        status = self.is_open_now()
+        return f"""🕐 CURRENT STATUS:
 Day: {status['day']}
 Time: {status['time']}
 Status: {'🟢 OPEN' if status['is_open'] else '🔴 CLOSED'}
 Hours: {status.get('opens', '')} - {status.get('closes', '')}
 
-📅 WEEKLY HOURS:
 """
+    
+    def _segment_weekly_hours(self) -> str:
+        lines = ["📅 WEEKLY HOURS:\n"]
         for t in self.timings.get("weekly", []):
             icon = "🟢" if t.get("status", "").lower() == "open" else "🔴"
-            ctx += f"  {t['day']}: {t['opens']} - {t['closes']} {icon}\n"
-        
-        ctx += "\n🍽️ MEAL TIMES:\n"
+            lines.append(f"  {t['day']}: {t['opens']} - {t['closes']} {icon}\n")
+        return "".join(lines)
+    
+    def _segment_meals(self) -> str:
+        lines = ["\n🍽️ MEAL TIMES:\n"]
         for m in self.timings.get("meals", []):
-            ctx += f"  {m['meal_type']}: {m['start_time']} - {m['end_time']}\n"
-        
-        ctx += "\n📋 MENU:\n"
-        
-        # Group by category
-        categories = {}
-        for item in self.menu:
-            cat = item.get("Category", "Other")
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(item)
-        
-        for cat, items in categories.items():
-            ctx += f"\n【{cat.upper()}】\n"
-            for item in items:
-                name = item.get("Item_Name", "")
-                price = item.get("Regular_Price", item.get("Price", ""))
-                avail = "✅" if item.get("Available", "").lower() == "yes" else "❌"
-                best = "⭐" if item.get("Is_Bestseller", "").lower() == "yes" else ""
-                spicy = "🌶️" if item.get("Is_Spicy", "").lower() == "yes" else ""
-                ctx += f"  • {name} - ${price} {best}{spicy} {avail}\n"
-        
-        ctx += "\n🏪 FACILITIES:\n"
+            lines.append(f"  {m['meal_type']}: {m['start_time']} - {m['end_time']}\n")
+        return "".join(lines)
+    
+    @staticmethod
+    def format_category(category: str, items: Iterable[MenuItem], descriptions: bool = False) -> str:
+        """One 【CATEGORY】 block of the menu context"""
+        lines = [f"\n【{category.upper()}】\n"]
+        for item in items:
+            lines.append(item.context_line(descriptions))
+        return "".join(lines)
+    
+    def _segment_menu(self) -> str:
+        blocks = ["\n📋 MENU:\n"]
+        for cat, items in self.menu_index["grouped"].items():
+            blocks.append(self.format_category(cat, items))
+        return "".join(blocks)
+    
+    def _segment_facilities(self) -> str:
+        lines = ["\n🏪 FACILITIES:\n"]
         for e in self.extras:
             if e.get("Available", "").lower() == "yes":
-                ctx += f"  ✓ {e.get('Feature', '')}\n"
+                lines.append(f"  ✓ {e.get('Feature', '')}\n")
+        return "".join(lines)
+    
+    def context_segment(self, name: str) -> str:
+        """One context segment; static ones are built once per data version"""
+        build = getattr(self, f"_segment_{name}")
+        if name == "status":
+            return build()
+        return self._derive(f"context_{name}", self.SEGMENT_SECTIONS[name], build)
+    
+    def static_context(self) -> str:
+        """Every segment but status, in prompt order; byte-stable until the data changes"""
+        return self._derive(
+            "context_static",
+            self.SECTIONS,
+            lambda: "".join(self.context_segment(n) for n in self.CONTEXT_SEGMENTS if n != "status")
+        )
+    
+    def to_context(self) -> str:
+        """Format as LLM context"""
+        status = self.context_segment("status")
+        
+        # Same minute, same snapshot: reuse the joined string
+        cached = self._context_cache
+        if cached is not None and cached[0] == status:
+            return cached[1]
         
-        return ctx
\ No newline at end of file
+        ctx = "".join(
+            status if name == "status" else self.context_segment(name)
+            for name in self.CONTEXT_SEGMENTS
+        )
+        self._context_cache = (status, ctx)
+        return ctx
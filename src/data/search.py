@@ -0,0 +1,156 @@
+"""
+Menu Search - Ranked full-text index over menu items
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, List, Sequence, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "can", "do", "does", "for", "have", "how", "i", "in", "is",
+    "it", "me", "much", "my", "of", "on", "or", "please", "s", "some", "the", "to",
+    "what", "whats", "which", "with", "you", "your", "any", "there", "get", "want"
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case alphanumeric tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    """Character trigrams with word boundary markers"""
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MenuSearchIndex:
+    """Inverted index with prefix and trigram fuzzy matching, BM25 ranking"""
+
+    K1 = 1.2
+    B = 0.75
+    NAME_WEIGHT = 3.0
+    CATEGORY_WEIGHT = 1.5
+    DESCRIPTION_WEIGHT = 1.0
+
+    PREFIX_WEIGHT = 0.7
+    FUZZY_WEIGHT = 0.6
+    FUZZY_THRESHOLD = 0.5  # Dice coefficient over trigrams
+    MAX_EXPANSIONS = 8
+    MAX_POSTINGS = 500  # Impact-ordered: common terms only contribute their best docs
+
+    def __init__(self, items: Sequence):
+        self.items = list(items)
+
+        # term -> {doc_id: field-weighted term frequency}
+        frequencies: Dict[str, Dict[int, float]] = {}
+        lengths: List[float] = []
+
+        for doc_id, item in enumerate(self.items):
+            length = 0.0
+            for text, weight in (
+                (item.name, self.NAME_WEIGHT),
+                (item.category, self.CATEGORY_WEIGHT),
+                (item.description, self.DESCRIPTION_WEIGHT)
+            ):
+                for term in tokenize(text):
+                    docs = frequencies.setdefault(term, {})
+                    docs[doc_id] = docs.get(doc_id, 0.0) + weight
+                    length += weight
+            lengths.append(length)
+
+        n_docs = len(self.items)
+        avg_length = (sum(lengths) / n_docs) if n_docs else 1.0
+
+        # Precompute BM25 impact per (term, doc), best first
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for term, docs in frequencies.items():
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            impacts = []
+            for doc_id, tf in docs.items():
+                norm = self.K1 * (1 - self.B + self.B * lengths[doc_id] / avg_length)
+                impacts.append((doc_id, idf * tf * (self.K1 + 1) / (tf + norm)))
+            impacts.sort(key=itemgetter(1), reverse=True)
+            self.postings[term] = impacts
+
+        self.vocabulary = sorted(self.postings)
+        self._grams: Dict[str, List[str]] = {}
+        self._gram_counts: Dict[str, int] = {}
+        for term in self.vocabulary:
+            grams = trigrams(term)
+            self._gram_counts[term] = len(grams)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(term)
+
+    def _prefix_terms(self, token: str) -> List[str]:
+        vocabulary = self.vocabulary
+        i = bisect_left(vocabulary, token)
+        terms = []
+        while i < len(vocabulary) and len(terms) < self.MAX_EXPANSIONS:
+            term = vocabulary[i]
+            if not term.startswith(token):
+                break
+            if term != token:
+                terms.append(term)
+            i += 1
+        return terms
+
+    def _fuzzy_terms(self, token: str) -> List[Tuple[str, float]]:
+        grams = trigrams(token)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for term in self._grams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+
+        matches = []
+        for term, count in shared.items():
+            if abs(len(term) - len(token)) > 2:
+                continue
+            dice = 2 * count / (len(grams) + self._gram_counts[term])
+            if dice >= self.FUZZY_THRESHOLD:
+                matches.append((term, dice))
+        return heapq.nlargest(self.MAX_EXPANSIONS, matches, key=itemgetter(1))
+
+    def expand(self, query: str) -> Dict[str, float]:
+        """Query -> {index term: weight} (exact, prefix, then fuzzy)"""
+        terms: Dict[str, float] = {}
+
+        def add(term: str, weight: float):
+            if weight > terms.get(term, 0.0):
+                terms[term] = weight
+
+        for token in dict.fromkeys(tokenize(query)):
+            if token in STOPWORDS:
+                continue
+
+            found = token in self.postings
+            if found:
+                add(token, 1.0)
+
+            if len(token) >= 2:
+                for term in self._prefix_terms(token):
+                    add(term, self.PREFIX_WEIGHT)
+                    found = True
+
+            if not found and len(token) >= 3:
+                for term, similarity in self._fuzzy_terms(token):
+                    add(term, self.FUZZY_WEIGHT * similarity)
+
+        return terms
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[object, float]]:
+        """Top `limit` (item, score) pairs for the query"""
+        scores: Dict[int, float] = {}
+
+        for term, weight in self.expand(query).items():
+            for doc_id, impact in islice(self.postings[term], self.MAX_POSTINGS):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * impact
+
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [(self.items[doc_id], score) for doc_id, score in best]
@@ -2,20 +2,61 @@
 Google Sheets Client - Fetch HFC Restaurant Data
 """
 
-import pandas as pd
-from typing import Dict, List, Optional
+import csv
+import hashlib
+import io
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 from configure import Config
+from src.data.cache import SheetCache
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class GoogleSheetsClient:
     """Fetch data from public Google Sheets"""
     
-    def __init__(self):
+    EMPTY = {
+        "restaurant_info": dict,
+        "timings": lambda: {"weekly": [], "meals": []},
+        "menu": list,
+        "extras": list
+    }
+    
+    def __init__(self, session: Optional[requests.Session] = None, cache: Optional[SheetCache] = None):
         self.sheet_ids = Config.SHEET_IDS
-        self.base_url = "https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv"
+        self.base_url = Config.SHEETS_BASE_URL
+        self.session = session or self._create_session()
+        self.cache = cache or (SheetCache() if Config.CACHE_ENABLED else None)
+        self.last_timings: Dict[str, float] = {}
+        self.hashes: Dict[str, Optional[str]] = {}
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Keep-alive session shared by all sheet fetches"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Config.SHEETS_POOL_SIZE,
+            pool_maxsize=Config.SHEETS_POOL_SIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _timeout(self, sheet_name: str) -> tuple:
+        """(connect, read) timeout for a sheet"""
+        read = Config.SHEETS_READ_TIMEOUTS.get(sheet_name, Config.SHEETS_READ_TIMEOUT)
+        return (Config.SHEETS_CONNECT_TIMEOUT, read)
     
-    def _fetch_sheet(self, sheet_name: str) -> Optional[pd.DataFrame]:
-        """Fetch single sheet as DataFrame"""
+    def _fetch_sheet(self, sheet_name: str, entry: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Fetch single sheet, conditional on cached validators (ETag / Last-Modified)"""
         sheet_id = self.sheet_ids.get(sheet_name)
         
         
@@ -23,46 +64,177 @@ class GoogleSheetsClient:
             print(f" Sheet ID not found: {sheet_name}")
             return None
         
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        start = time.perf_counter()
         try:
             url = self.base_url.format(sheet_id=sheet_id)
-            df = pd.read_csv(url)
-            return df
+            response = self.session.get(url, headers=headers, timeout=self._timeout(sheet_name))
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
         except Exception as e:
             print(f" Error fetching {sheet_name}: {e}")
             return None
+        finally:
+            self.last_timings[sheet_name] = time.perf_counter() - start
     
-    def get_restaurant_info(self) -> Dict:
-        """Get restaurant basic info"""
-        df = self._fetch_sheet("restaurant_info")
+    def _parse_sheet(self, sheet_name: str, response: requests.Response) -> Optional[Any]:
+        """Parse a sheet response, None if the CSV is unreadable"""
+        try:
+            return self.parse_csv(sheet_name, response.text)
+        except Exception as e:
+            print(f" Error parsing {sheet_name}: {e}")
+            return None
+    
+    @classmethod
+    def parse_csv(cls, sheet_name: str, text: str, parser: Optional[str] = None) -> Any:
+        """Parse CSV text of a sheet ("pandas" or pandas-free "csv" ingest)"""
+        parser = parser or Config.SHEETS_PARSER
+        if parser == "csv":
+            columns, rows = cls._rows_from_csv(text)
+        else:
+            import pandas as pd  # ~0.5 s import, only paid by the pandas parser
+            
+            columns, rows = cls._rows_from_dataframe(pd.read_csv(io.StringIO(text)))
+        build = getattr(cls, f"_parse_{sheet_name}")
+        return build(columns, rows)
+    
+    @staticmethod
+    def _rows_from_dataframe(df: "pd.DataFrame") -> Tuple[List[str], List[tuple]]:
+        """Column-wise clean (NaN -> "", strip), then one pass into row tuples"""
+        columns = [str(col).strip() for col in df.columns]
+        values = [
+            series.where(series.notna(), "").astype(str).str.strip().tolist()
+            for _, series in df.items()
+        ]
+        return columns, list(zip(*values))
+    
+    @staticmethod
+    def _rows_from_csv(text: str) -> Tuple[List[str], List[List[str]]]:
+        """Stream rows with the csv module (values kept as written in the sheet)"""
+        reader = csv.reader(io.StringIO(text))
+        columns = [col.strip() for col in next(reader, [])]
+        width = len(columns)
+        
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            row = [cell.strip() for cell in row]
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            rows.append(row)
+        return columns, rows
+    
+    def _unchanged(self, sheet_name: str, entry: Dict) -> Tuple[Any, Optional[str]]:
+        """Sheet content unchanged: keep cached data, restart its TTL"""
+        try:
+            self.cache.touch(sheet_name, entry)
+        except Exception as e:
+            print(f" Cache write failed for {sheet_name}: {e}")
+        return entry["data"], entry.get("hash")
+    
+    def _refresh_sheet(self, sheet_name: str, fallback: Optional[Dict] = None) -> Tuple[Any, Optional[str]]:
+        """(data, content hash) fetched from network, cache updated; last good copy on failure
+
+        The hash is returned rather than stored, so a background revalidation
+        never pairs its hash with data the caller did not get.
+        """
+        response = self._fetch_sheet(sheet_name, fallback)
+        
+        # 304 or identical body: skip the parse entirely
+        digest = None
+        if response is not None and fallback is not None:
+            if response.status_code == 304:
+                return self._unchanged(sheet_name, fallback)
+            digest = hashlib.sha256(response.content).hexdigest()
+            if digest == fallback.get("hash"):
+                return self._unchanged(sheet_name, fallback)
+        
+        data = self._parse_sheet(sheet_name, response) if response is not None else None
+        
+        if data is None:
+            if fallback is not None:
+                print(f" Using cached {sheet_name} (fetch failed)")
+                return fallback["data"], fallback.get("hash")
+            return self.EMPTY[sheet_name](), None
+        
+        digest = digest or hashlib.sha256(response.content).hexdigest()
+        
+        if self.cache:
+            try:
+                self.cache.save(
+                    sheet_name,
+                    data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    hash=digest
+                )
+            except Exception as e:
+                print(f" Cache write failed for {sheet_name}: {e}")
+        return data, digest
+    
+    def _revalidate_async(self, sheet_name: str, entry: Dict):
+        """Refresh a stale sheet in the background (stale-while-revalidate)"""
+        with self._revalidating_lock:
+            if sheet_name in self._revalidating:
+                return
+            self._revalidating.add(sheet_name)
+        
+        def run():
+            try:
+                self._refresh_sheet(sheet_name, fallback=entry)
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(sheet_name)
         
-        if df is None or df.empty:
-            return {}
+        threading.Thread(target=run, name=f"revalidate-{sheet_name}", daemon=True).start()
+    
+    def _get_sheet(self, sheet_name: str, force_refresh: bool = False) -> Tuple[Any, Optional[str]]:
+        """(parsed sheet, content hash), served from disk cache when possible"""
+        if not self.cache:
+            return self._refresh_sheet(sheet_name)
+        
+        start = time.perf_counter()
+        entry = self.cache.load(sheet_name)
+        
+        if entry is None or force_refresh:
+            return self._refresh_sheet(sheet_name, fallback=entry)
+        
+        if not self.cache.is_fresh(entry):
+            self._revalidate_async(sheet_name, entry)
         
+        self.last_timings[sheet_name] = time.perf_counter() - start
+        return entry["data"], entry.get("hash")
+    
+    @staticmethod
+    def _parse_restaurant_info(columns: List[str], rows: List[Sequence[str]]) -> Dict:
+        """Parse restaurant basic info"""
         info = {}
-        for _, row in df.iterrows():
-            field = str(row.iloc[0]).strip()
-            value = str(row.iloc[1]).strip() if len(row) > 1 else ""
+        for row in rows:
+            field = row[0] if row else ""
+            value = row[1] if len(row) > 1 else ""
             
-            if field and field.lower() != "field" and value != "nan":
+            if field and field.lower() != "field" and value:
                 info[field] = value
         
         return info
     
-    def get_timings(self) -> Dict:
-        """Get opening/closing timings"""
-        df = self._fetch_sheet("timings")
-        
-        if df is None or df.empty:
-            return {"weekly": [], "meals": []}
-        
+    @staticmethod
+    def _parse_timings(columns: List[str], rows: List[Sequence[str]]) -> Dict:
+        """Parse opening/closing timings"""
         result = {"weekly": [], "meals": []}
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         meals = ["Breakfast", "Lunch", "Dinner"]
         
-        for _, row in df.iterrows():
-            row_data = [str(cell).strip() for cell in row.tolist()]
-            
-            if not row_data[0] or row_data[0].lower() in ["day", "meal_type", "nan"]:
+        for row_data in rows:
+            if not row_data or not row_data[0] or row_data[0].lower() in ["day", "meal_type", "nan"]:
                 continue
             
             if row_data[0] in days:
@@ -81,66 +253,75 @@ class GoogleSheetsClient:
         
         return result
     
-    def get_menu(self) -> List[Dict]:
+    @staticmethod
+    def _records(columns: List[str], rows: List[Sequence[str]], required: Tuple[str, ...]) -> List[Dict]:
+        """Rows -> dicts keyed by clean column names, keeping rows with any required field"""
+        keys = [col.replace(" ", "_") for col in columns]
+        positions = [i for i, key in enumerate(keys) if key in required]
+        return [
+            dict(zip(keys, row)) for row in rows
+            if any(row[i] for i in positions)
+        ]
+    
+    @staticmethod
+    def _parse_menu(columns: List[str], rows: List[Sequence[str]]) -> List[Dict]:
+        """Parse full menu"""
+        return GoogleSheetsClient._records(columns, rows, ("Item_Name", "Item"))
+    
+    @staticmethod
+    def _parse_extras(columns: List[str], rows: List[Sequence[str]]) -> List[Dict]:
+        """Parse extras/facilities"""
+        return GoogleSheetsClient._records(columns, rows, ("Feature", "Category"))
+    
+    def get_restaurant_info(self, force_refresh: bool = False) -> Dict:
+        """Get restaurant basic info"""
+        return self._get_sheet("restaurant_info", force_refresh)[0]
+    
+    def get_timings(self, force_refresh: bool = False) -> Dict:
+        """Get opening/closing timings"""
+        return self._get_sheet("timings", force_refresh)[0]
+    
+    def get_menu(self, force_refresh: bool = False) -> List[Dict]:
         """Get full menu"""
-        df = self._fetch_sheet("menu")
-        
-        if df is None or df.empty:
-            return []
-        
-        menu = []
-        columns = df.columns.tolist()
-        
-        for _, row in df.iterrows():
-            item = {}
-            for col in columns:
-                value = row[col]
-                value = "" if pd.isna(value) else str(value).strip()
-                clean_col = col.strip().replace(" ", "_")
-                item[clean_col] = value
-            
-            if item.get("Item_Name") or item.get("Item"):
-                menu.append(item)
-        
-        return menu
+        return self._get_sheet("menu", force_refresh)[0]
     
-    def get_extras(self) -> List[Dict]:
+    def get_extras(self, force_refresh: bool = False) -> List[Dict]:
         """Get extras/facilities"""
-        df = self._fetch_sheet("extras")
+        return self._get_sheet("extras", force_refresh)[0]
+    
+    def get_all_data(self, concurrent: Optional[bool] = None, *, force_refresh: bool = False) -> Dict:
+        """Fetch all data (disk cache first, network when stale or forced)"""
+        print("📡 Fetching data from Google Sheets...")
         
-        if df is None or df.empty:
-            return []
+        if concurrent is None:
+            concurrent = Config.SHEETS_CONCURRENT
         
-        extras = []
-        columns = df.columns.tolist()
+        sheets = list(self.EMPTY)
         
-        for _, row in df.iterrows():
-            item = {}
-            for col in columns:
-                value = row[col]
-                value = "" if pd.isna(value) else str(value).strip()
-                clean_col = col.strip().replace(" ", "_")
-                item[clean_col] = value
-            
-            if item.get("Feature") or item.get("Category"):
-                extras.append(item)
+        self.last_timings = {}
+        start = time.perf_counter()
         
-        return extras
-    
-    def get_all_data(self) -> Dict:
-        """Fetch all data"""
-        print("📡 Fetching data from Google Sheets...")
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=len(sheets)) as pool:
+                futures = {name: pool.submit(self._get_sheet, name, force_refresh) for name in sheets}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: self._get_sheet(name, force_refresh) for name in sheets}
         
-        data = {
-            "restaurant_info": self.get_restaurant_info(),
-            "timings": self.get_timings(),
-            "menu": self.get_menu(),
-            "extras": self.get_extras()
-        }
+        # Hashes of exactly the data returned (background revalidation only updates the cache)
+        data = {name: sheet for name, (sheet, _) in results.items()}
+        self.hashes = {name: digest for name, (_, digest) in results.items()}
+        self.last_timings["total"] = time.perf_counter() - start
         
         print(" Data fetched successfully!")
+        self.print_timings()
         # print(data)
         return data
+    
+    def print_timings(self):
+        """Print per-sheet fetch timings of the last run"""
+        for name, seconds in self.last_timings.items():
+            print(f"   {name}: {seconds * 1000:.0f} ms")
 
 
 # Test
@@ -0,0 +1,207 @@
+"""
+Data Sources - Interchangeable loaders for the restaurant sheets
+
+Google Sheets over HTTP, a local directory of CSV exports, or a columnar
+Parquet / Arrow snapshot; HFCAgent only needs `get_all_data` and `hashes`.
+"""
+
+import argparse
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple, runtime_checkable
+
+from configure import Config
+from src.data.sheets_client import GoogleSheetsClient
+
+SHEETS = tuple(GoogleSheetsClient.EMPTY)
+
+
+@runtime_checkable
+class DataSource(Protocol):
+    """Anything that returns the four parsed sheets plus a content hash per sheet"""
+
+    hashes: Dict[str, Optional[str]]
+
+    def get_all_data(self, *, force_refresh: bool = False) -> Dict:
+        ...
+
+
+class FileSource(ABC):
+    """One file per sheet in a directory; unchanged files are not parsed again
+
+    Files are re-read on every load (cheap), hashed, and only parsed when the
+    content hash differs from the last load, so the background refresher costs
+    little when nothing changed.
+    """
+
+    SUFFIX = ""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or Config.DATA_SOURCE_DIR)
+        self.suffix = self.SUFFIX
+        self.hashes: Dict[str, Optional[str]] = {}
+        self.last_timings: Dict[str, float] = {}
+        self._data: Dict[str, Any] = {}
+
+    def path(self, sheet_name: str) -> Path:
+        return self.directory / f"{sheet_name}{self.suffix}"
+
+    @abstractmethod
+    def _parse(self, sheet_name: str, raw: bytes) -> Any:
+        """File bytes -> parsed sheet"""
+
+    def _get_sheet(self, sheet_name: str) -> Any:
+        """Parsed sheet; last good copy (or empty) when the file is missing or bad"""
+        start = time.perf_counter()
+        path = self.path(sheet_name)
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            print(f" Cannot read {path}: {e}")
+            self.hashes[sheet_name] = None
+            return self._data.get(sheet_name, GoogleSheetsClient.EMPTY[sheet_name]())
+
+        digest = hashlib.sha256(raw).hexdigest()
+        if sheet_name not in self._data or self.hashes.get(sheet_name) != digest:
+            try:
+                self._data[sheet_name] = self._parse(sheet_name, raw)
+            except Exception as e:
+                print(f" Error parsing {path}: {e}")
+                self.hashes[sheet_name] = None
+                return self._data.get(sheet_name, GoogleSheetsClient.EMPTY[sheet_name]())
+
+        self.hashes[sheet_name] = digest
+        self.last_timings[sheet_name] = time.perf_counter() - start
+        return self._data[sheet_name]
+
+    def get_all_data(self, *, force_refresh: bool = False) -> Dict:
+        """Load all sheets (files are always re-read, so force_refresh changes nothing)"""
+        print(f"📂 Loading data from {self.directory}...")
+        self.last_timings = {}
+        start = time.perf_counter()
+        data = {name: self._get_sheet(name) for name in SHEETS}
+        self.last_timings["total"] = time.perf_counter() - start
+        print(" Data loaded successfully!")
+        self.print_timings()
+        return data
+
+    def print_timings(self):
+        """Print per-sheet load timings of the last run"""
+        for name, seconds in self.last_timings.items():
+            print(f"   {name}: {seconds * 1000:.0f} ms")
+
+
+class LocalCSVSource(FileSource):
+    """Directory of sheet CSV exports: restaurant_info.csv, timings.csv, menu.csv, extras.csv"""
+
+    SUFFIX = ".csv"
+
+    def __init__(self, directory: Optional[Path] = None, parser: Optional[str] = None):
+        super().__init__(directory)
+        self.parser = parser
+
+    def _parse(self, sheet_name: str, raw: bytes) -> Any:
+        return GoogleSheetsClient.parse_csv(sheet_name, raw.decode("utf-8-sig"), self.parser)
+
+
+class ParquetSource(FileSource):
+    """Columnar snapshot of the sheets, Parquet or Arrow IPC (needs pyarrow)
+
+    Each file holds the sheet in its original layout, so the same builders as
+    the CSV path produce the data. Snapshots written by `write` are already
+    string columns; other files' columns are cast to strings (nulls -> "").
+    """
+
+    FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+    def __init__(self, directory: Optional[Path] = None, fmt: str = "parquet"):
+        # Optional dependency, imported on use (~150 ms): the default sheets source never pays it
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("pyarrow is required for Parquet / Arrow data sources") from e
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown snapshot format: {fmt}")
+        super().__init__(directory)
+        self.fmt = fmt
+        self.suffix = self.FORMATS[fmt]
+
+    def _parse(self, sheet_name: str, raw: bytes) -> Any:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        buffer = pa.BufferReader(raw)
+        if self.fmt == "parquet":
+            table = pq.read_table(buffer)
+        else:
+            table = pa.ipc.open_file(buffer).read_all()
+        # Files written by other tools (pandas.to_parquet, ...) have typed columns
+        # and nulls; the builders expect stripped strings, as from the CSV path
+        columns = [str(col).strip() for col in table.column_names]
+        values = [
+            pc.utf8_trim_whitespace(pc.fill_null(column.cast(pa.string()), "")).to_pylist()
+            for column in table.columns
+        ]
+        rows = list(zip(*values))
+        build = getattr(GoogleSheetsClient, f"_parse_{sheet_name}")
+        return build(columns, rows)
+
+    @staticmethod
+    def _sheet_rows(sheet_name: str, value: Any) -> Tuple[List[str], List[Sequence[str]]]:
+        """Parsed sheet -> (columns, rows) its builder turns back into the same value"""
+        if sheet_name == "restaurant_info":
+            return ["Field", "Value"], list(value.items())
+        if sheet_name == "timings":
+            rows = [(d["day"], d["opens"], d["closes"], d["status"]) for d in value["weekly"]]
+            rows += [(m["meal_type"], m["start_time"], m["end_time"], "") for m in value["meals"]]
+            return ["Day", "Opens", "Closes", "Status"], rows
+        columns = list(dict.fromkeys(key for record in value for key in record))
+        return columns, [tuple(record.get(col, "") for col in columns) for record in value]
+
+    def write(self, data: Dict):
+        """Snapshot parsed data (from any DataSource) into this source's directory"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for sheet_name in SHEETS:
+            columns, rows = self._sheet_rows(sheet_name, data.get(sheet_name) or GoogleSheetsClient.EMPTY[sheet_name]())
+            values = list(zip(*rows)) if rows else [()] * len(columns)
+            table = pa.table({col: pa.array(list(v), pa.string()) for col, v in zip(columns, values)})
+            path = self.path(sheet_name)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            if self.fmt == "parquet":
+                pq.write_table(table, tmp)
+            else:
+                with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            tmp.replace(path)  # readers never see a half-written file
+
+
+def create_source(kind: Optional[str] = None, directory: Optional[Path] = None) -> DataSource:
+    """Data source from config: "sheets", "csv", "parquet" or "arrow" """
+    kind = kind or Config.DATA_SOURCE
+    if kind == "sheets":
+        return GoogleSheetsClient()
+    if kind == "csv":
+        return LocalCSVSource(directory)
+    if kind in ParquetSource.FORMATS:
+        return ParquetSource(directory, kind)
+    raise ValueError(f"Unknown data source: {kind}")
+
+
+# Snapshot the sheets for fast local loading
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a Parquet / Arrow snapshot of the restaurant sheets")
+    parser.add_argument("--source", default="sheets", help="sheets, csv, parquet or arrow")
+    parser.add_argument("--source-dir", help="directory of a local source")
+    parser.add_argument("--format", default="parquet", choices=list(ParquetSource.FORMATS))
+    parser.add_argument("--output", default=str(Config.DATA_SOURCE_DIR))
+    args = parser.parse_args()
+
+    data = create_source(args.source, args.source_dir).get_all_data()
+    ParquetSource(args.output, args.format).write(data)
+    print(f"Snapshot written to {args.output} ({args.format})")
@@ -0,0 +1,127 @@
+"""
+Response Cache - In-memory LRU + optional shared SQLite tier for LLM answers
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from configure import Config
+from src.data.models import RestaurantData
+from src.data.search import tokenize
+
+
+class ResponseCache:
+    """Answers keyed by normalized question + data fingerprint + open/closed state"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        db_path: Optional[str] = None
+    ):
+        self.max_size = max_size or Config.RESPONSE_CACHE_SIZE
+        self.ttl = Config.RESPONSE_CACHE_TTL if ttl is None else ttl
+        self._memory: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "saved_ms": 0.0}
+
+        db_path = db_path if db_path is not None else Config.RESPONSE_CACHE_DB
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str):
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(db_path, timeout=5, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")  # readers don't block the writing worker
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created REAL NOT NULL, latency_ms REAL NOT NULL)"
+            )
+            self._db = db
+        except sqlite3.Error as e:
+            print(f" Response cache DB unavailable: {e}")
+            self._db = None
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Lower-case words only; punctuation and spacing dropped"""
+        return " ".join(tokenize(question))
+
+    @staticmethod
+    def key(question: str, data: RestaurantData, scope: str = "") -> str:
+        """Cache key; changes when the menu/hours change or the restaurant opens/closes"""
+        is_open = data.is_open_now()["is_open"]
+        raw = f"{ResponseCache.normalize(question)}|{data.fingerprint}|{int(is_open)}|{scope}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, created, latency_ms = entry
+                if now - created < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    self.stats["saved_ms"] += latency_ms
+                    return response
+                del self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT response, created, latency_ms FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f" Response cache read failed: {e}")
+                    row = None
+                if row is not None and now - row[1] < self.ttl:
+                    self._remember(key, row)
+                    self.stats["disk_hits"] += 1
+                    self.stats["saved_ms"] += row[2]
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def _remember(self, key: str, entry: Tuple[str, float, float]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def put(self, key: str, response: str, latency_ms: float):
+        entry = (response, time.time(), latency_ms)
+
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses (key, response, created, latency_ms) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, *entry)
+                    )
+                    self._db.execute("DELETE FROM responses WHERE created < ?", (entry[1] - self.ttl,))
+                except sqlite3.Error as e:
+                    print(f" Response cache write failed: {e}")
+
+    def report(self) -> Dict:
+        """Hit rate and latency saved so far"""
+        with self._lock:
+            stats = dict(self.stats)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        total = hits + stats["misses"]
+        stats["hit_rate"] = hits / total if total else 0.0
+        stats["entries"] = len(self._memory)
+        return stats
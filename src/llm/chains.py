@@ -2,40 +2,138 @@
 LangChain Chains - HFC Agent (OpenRouter)
 """
 
-from typing import Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import StrOutputParser
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from configure import Config
-from src.data.sheets_client import GoogleSheetsClient
 from src.data.models import RestaurantData
+from src.data.sources import DataSource, create_source
+from src.llm.cache import ResponseCache
+from src.llm.client import CircuitBreaker, StreamRetry, create_chat_model
+from src.llm.hedging import HedgedChain
+from src.llm.memory import ConversationMemory
 from src.llm.prompts import HFCPrompts
+from src.llm.retrieval import ContextRetriever
+from src.llm.router import IntentRouter
+from src.llm.tokens import ContextBudget, TokenCounter
 
 
 class HFCAgent:
     """Main HFC AI Agent using LangChain + OpenRouter"""
     
-    def __init__(self):
+    def __init__(self, source: Optional[DataSource] = None):
         self.data: Optional[RestaurantData] = None
         self.chain = None
         self.llm = None
+        self.client = source or create_source()
+        self.retriever = ContextRetriever()
+        self.router = IntentRouter()
+        self.breaker = CircuitBreaker()
+        self.tokens = TokenCounter()
+        self.budget = ContextBudget(self.tokens)
+        self.recent_usage = deque(maxlen=100)
+        self.response_cache = ResponseCache() if Config.RESPONSE_CACHE_ENABLED else None
+        
+        # System message + human template without context/question
+        self._prompt_tokens = self.tokens.count(HFCPrompts.SYSTEM) + self.tokens.count(
+            HFCPrompts.HUMAN_TEMPLATE.format(context="", question="")
+        )
+        self._data_hashes = {}
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._prefix: Optional[Tuple[str, str, int]] = None  # (static context, prompt block, tokens)
+        self.layout_latency: Dict[str, List[float]] = {}  # layout -> [requests, total first-token ms]
+        self._refresh_lock = threading.Lock()
+        self._stop_refresh = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
         
         # Load data first
         self._load_data()
         
         # Setup LLM
         self._setup_llm()
+        
+        # Keep data fresh off the request path
+        self.start_refresher()
     
-    def _load_data(self):
-        """Load restaurant data from Google Sheets"""
-        try:
-            client = GoogleSheetsClient()
-            raw_data = client.get_all_data()
-            self.data = RestaurantData(raw_data)
-            print("Restaurant data loaded")
-        except Exception as e:
-            print(f"❌ Error loading data: {e}")
-            self.data = None
+    def _load_data(self, force_refresh: bool = False):
+        """Load restaurant data from the data source (Google Sheets: disk cache first)"""
+        with self._refresh_lock:
+            try:
+                raw_data = self.client.get_all_data(force_refresh=force_refresh)
+                hashes = dict(self.client.hashes)
+                current = self.data
+                
+                if current is None:
+                    snapshot = RestaurantData(raw_data)
+                else:
+                    # Failed fetches (no hash, empty result) keep the current section
+                    failed = [
+                        s for s in RestaurantData.SECTIONS
+                        if not hashes.get(s) and self._is_empty(raw_data.get(s))
+                    ]
+                    for s in failed:
+                        hashes[s] = self._data_hashes.get(s)
+                    # Sheets whose content hash matches the current snapshot are skipped
+                    changed = [
+                        s for s in RestaurantData.SECTIONS
+                        if s not in failed
+                        and (not hashes.get(s) or hashes.get(s) != self._data_hashes.get(s))
+                    ]
+                    snapshot = current.updated(raw_data, changed)
+                
+                self._data_hashes = hashes
+                
+                if snapshot is current:
+                    print("Restaurant data unchanged")
+                    return
+                
+                # Build derived state before publishing, then swap the reference
+                snapshot.warm()
+                self.data = snapshot
+                
+                if current is None:
+                    print("Restaurant data loaded")
+                else:
+                    print(f"Restaurant data updated (v{snapshot.version}): {', '.join(snapshot.changed_sections)}")
+            except Exception as e:
+                # Keep serving the last good snapshot
+                print(f"❌ Error loading data: {e}")
+    
+    @staticmethod
+    def _is_empty(section) -> bool:
+        """Nothing loaded: None, {}, [] or timings with no rows"""
+        if isinstance(section, dict) and section and all(isinstance(v, list) for v in section.values()):
+            return not any(section.values())
+        return not section
+    
+    def _refresh_loop(self, interval: float):
+        """Background refresher: poll sheets, publish new snapshots"""
+        while not self._stop_refresh.wait(interval):
+            self._load_data(force_refresh=True)
+    
+    def start_refresher(self, interval: Optional[float] = None):
+        """Start background data refresh every `interval` seconds"""
+        interval = Config.REFRESH_INTERVAL if interval is None else interval
+        if interval <= 0 or (self._refresher and self._refresher.is_alive()):
+            return
+        
+        self._stop_refresh.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, args=(interval,), name="hfc-data-refresher", daemon=True
+        )
+        self._refresher.start()
+        print(f" Background refresh every {interval:.0f}s")
+    
+    def stop_refresher(self):
+        """Stop background data refresh"""
+        self._stop_refresh.set()
+        if self._refresher:
+            self._refresher.join(timeout=5)
+            self._refresher = None
     
     def _setup_llm(self):
         """Setup LangChain with OpenRouter"""
@@ -48,18 +146,21 @@ class HFCAgent:
                 self.chain = None
                 return
             
-            # OpenRouter LLM using ChatOpenAI
-            self.llm = ChatOpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=api_key,
-                model=Config.LLM_MODEL,
-                temperature=Config.LLM_TEMPERATURE,
-                max_tokens=Config.LLM_MAX_TOKENS
-            )
+            # Imported here: output parsers are only needed when an LLM is configured
+            from langchain_core.output_parsers import StrOutputParser
+            
+            # OpenRouter LLM using ChatOpenAI (timeouts, pooled connections, retries)
+            models = Config.LLM_MODELS or [Config.LLM_MODEL]
+            llms = [create_chat_model(api_key, model) for model in models]
+            self.llm = llms[0]
             
             # Create chain: Prompt -> LLM -> Output Parser
             prompt = HFCPrompts.get_chat_prompt()
-            self.chain = prompt | self.llm | StrOutputParser()
+            # with_retry doesn't cover streaming: retry until the first chunk
+            chains = [StreamRetry(prompt | llm | StrOutputParser()) for llm in llms]
+            
+            # More than one model: race the next one when the primary is slow
+            self.chain = chains[0] if len(chains) == 1 else HedgedChain(chains, models)
             
             print(" LangChain + OpenRouter initialized")
             
@@ -69,81 +170,432 @@ class HFCAgent:
             self.chain = None
     
     def refresh_data(self):
-        """Refresh data from Google Sheets"""
-        self._load_data()
+        """Refresh data from the data source"""
+        self._load_data(force_refresh=True)
         return self.data is not None
     
-    def process_query(self, question: str) -> str:
+    def process_query(self, question: str, memory: Optional[ConversationMemory] = None) -> str:
         """Process user query and return response"""
+        return self.answer(question, memory)["response"]
+    
+    def _shortcut(
+        self,
+        question: str,
+        data: RestaurantData,
+        memory: Optional[ConversationMemory] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """(router/cache result or None, response cache key) - the paths that skip the LLM"""
+        # Hours / location / menu / bestsellers: answered from the data directly.
+        # Follow-ups ("is it popular?") may lean on earlier turns: route only sure things
+        threshold = max(self.router.threshold, Config.ROUTER_FOLLOWUP_THRESHOLD) if memory else None
+        routed = self.router.route(question, data, threshold)
+        if routed:
+            return {"response": routed[1], "source": "router", "intent": routed[0], "usage": None}, None
+        
+        # Follow-ups depend on earlier turns, so they can't share cached answers
+        if memory:
+            return None, None
         
-        if not self.data:
-            return "Sorry, I couldn't load restaurant data. Please try again."
+        # Same question, same data, same open/closed state: reuse the answer
+        cache_key = self.response_cache.key(question, data) if self.response_cache else None
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return {"response": cached, "source": "cache", "usage": None}, cache_key
+        return None, cache_key
+    
+    def answer(self, question: str, memory: Optional[ConversationMemory] = None) -> Dict:
+        """Process user query; response plus source, token usage and latency
+        
+        With a memory, earlier turns go into the prompt and this turn is added to it.
+        """
+        start = time.perf_counter()
+        
+        # One snapshot per query; the refresher may swap self.data meanwhile
+        data = self.data
+        if not data:
+            return self._no_data_result()
         
-        # Get context from data
-        context = self.data.to_context()
+        result, cache_key = self._shortcut(question, data, memory)
+        if result is None:
+            response, source, usage = self._invoke(question, data, memory)
+            result = {"response": response, "source": source, "usage": usage}
+        
+        result["latency_ms"] = (time.perf_counter() - start) * 1000
+        if cache_key and result["source"] == "llm":
+            self.response_cache.put(cache_key, result["response"], result["latency_ms"])
+        if memory is not None:
+            memory.add(question, result["response"])
+        self._record(result)
+        return result
+    
+    def _invoke(
+        self,
+        question: str,
+        data: RestaurantData,
+        memory: Optional[ConversationMemory] = None
+    ) -> Tuple[str, str, Optional[Dict]]:
+        """(response, source, usage) from the LLM chain, or the fallback"""
+        # Circuit open: answer from the data instead of waiting on a struggling provider
+        if not self.chain or not self.breaker.allow():
+            return self._fallback_response(question, data), "fallback", None
         
-        # Try LLM chain first
-        if self.chain:
+        try:
+            inputs, usage = self._prepare_inputs(data, question, memory)
+        except Exception as e:
+            # Not the provider's fault: fall back without touching the breaker
+            print(f" Prompt error: {e}")
+            return self._fallback_response(question, data), "fallback", None
+        
+        start = time.perf_counter()
+        try:
+            response = self.chain.invoke(inputs)
+            self.breaker.record(True, (time.perf_counter() - start) * 1000)
+            return response.strip(), "llm", usage
+        except Exception as e:
+            print(f" LLM error: {e}")
+            self.breaker.record(False)
+            return self._fallback_response(question, data), "fallback", usage
+    
+    def process_many(self, questions: List[str], max_concurrency: Optional[int] = None) -> List[Dict]:
+        """Answer a list of questions: router/cache first, the rest through chain.batch
+        
+        Duplicate questions share one LLM call and LLM answers go into the response
+        cache, so running this after a menu update pre-warms it. For LLM answers
+        latency_ms is measured from the start of the batch.
+        """
+        start = time.perf_counter()
+        
+        data = self.data
+        if not data:
+            return [self._no_data_result() for _ in questions]
+        
+        results: List[Optional[Dict]] = [None] * len(questions)
+        pending: Dict[str, List[int]] = {}  # cache key -> question indices
+        
+        for i, question in enumerate(questions):
+            asked = time.perf_counter()
+            result, cache_key = self._shortcut(question, data)
+            if result is not None:
+                result["latency_ms"] = (time.perf_counter() - asked) * 1000
+                results[i] = result
+            else:
+                pending.setdefault(cache_key or ResponseCache.key(question, data), []).append(i)
+        
+        keys = list(pending)
+        usages: List[Optional[Dict]] = [None] * len(keys)
+        
+        unsent: Dict[int, Exception] = {}  # key index -> error building its prompt
+        if self.chain and keys and self.breaker.allow():
+            inputs, sent = [], []
+            for n, key in enumerate(keys):
+                question = questions[pending[key][0]]
+                try:
+                    chain_inputs, usages[n] = self._prepare_inputs(data, question)
+                except Exception as e:
+                    unsent[n] = e  # this question falls back, the rest of the batch goes on
+                    continue
+                inputs.append(chain_inputs)
+                sent.append(n)
+            
+            config = {"max_concurrency": max_concurrency or Config.BATCH_CONCURRENCY}
+            batch = self.chain.batch_as_completed(inputs, config=config, return_exceptions=True) if inputs else ()
+            outputs = itertools.chain(unsent.items(), ((sent[m], output) for m, output in batch))
+        else:
+            outputs = ((n, None) for n in range(len(keys)))
+        
+        for n, output in outputs:
+            indices = pending[keys[n]]
+            latency_ms = (time.perf_counter() - start) * 1000
+            
+            if output is not None and self.chain and n not in unsent:
+                # Latency is batch-wide here, so only the outcome counts
+                self.breaker.record(isinstance(output, str))
+            
+            if isinstance(output, str):
+                response, source = output.strip(), "llm"
+                if self.response_cache:
+                    self.response_cache.put(keys[n], response, latency_ms)
+            else:
+                if output is not None:
+                    print(f" {'Prompt' if n in unsent else 'LLM'} error: {output}")
+                response, source = self._fallback_response(questions[indices[0]], data), "fallback"
+            
+            for rank, i in enumerate(indices):
+                results[i] = {
+                    "response": response,
+                    "source": "coalesced" if rank and source == "llm" else source,
+                    "usage": None if rank else usages[n],
+                    "latency_ms": latency_ms
+                }
+        
+        elapsed = time.perf_counter() - start
+        print(f" Batch: {len(questions)} questions, {len(keys) - len(unsent)} LLM calls in {elapsed:.1f}s")
+        return results
+    
+    async def aprocess_query(self, question: str, memory: Optional[ConversationMemory] = None) -> str:
+        """Async process_query; many conversations can share one event loop"""
+        return (await self.aanswer(question, memory))["response"]
+    
+    async def aanswer(self, question: str, memory: Optional[ConversationMemory] = None) -> Dict:
+        """Async answer(); identical questions already in flight share one LLM call"""
+        start = time.perf_counter()
+        
+        data = self.data
+        if not data:
+            return self._no_data_result()
+        
+        result, cache_key = self._shortcut(question, data, memory)
+        if result is None and memory:
+            response, source, usage = await self._ainvoke(question, data, memory)
+            result = {"response": response, "source": source, "usage": usage}
+        elif result is None:
+            # Keyed like the response cache, whether or not caching is enabled
+            key = (id(asyncio.get_running_loop()), cache_key or ResponseCache.key(question, data))
+            task = self._inflight.get(key)
+            shared = task is not None
+            if not shared:
+                task = asyncio.ensure_future(self._ainvoke(question, data))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+            
+            # Shielded: one caller going away must not cancel the call for the others
+            response, source, usage = await asyncio.shield(task)
+            result = {
+                "response": response,
+                "source": "coalesced" if shared and source == "llm" else source,
+                "usage": None if shared else usage
+            }
+        
+        result["latency_ms"] = (time.perf_counter() - start) * 1000
+        if cache_key and result["source"] == "llm":
+            self.response_cache.put(cache_key, result["response"], result["latency_ms"])
+        if memory is not None:
+            memory.add(question, result["response"])
+        self._record(result)
+        return result
+    
+    async def _ainvoke(
+        self,
+        question: str,
+        data: RestaurantData,
+        memory: Optional[ConversationMemory] = None
+    ) -> Tuple[str, str, Optional[Dict]]:
+        """Async _invoke using the chain's ainvoke"""
+        if not self.chain or not self.breaker.allow():
+            return self._fallback_response(question, data), "fallback", None
+        
+        try:
+            inputs, usage = self._prepare_inputs(data, question, memory)
+        except Exception as e:
+            # Not the provider's fault: fall back without touching the breaker
+            print(f" Prompt error: {e}")
+            return self._fallback_response(question, data), "fallback", None
+        
+        start = time.perf_counter()
+        try:
+            response = await self.chain.ainvoke(inputs)
+            self.breaker.record(True, (time.perf_counter() - start) * 1000)
+            return response.strip(), "llm", usage
+        except Exception as e:
+            print(f" LLM error: {e}")
+            self.breaker.record(False)
+            return self._fallback_response(question, data), "fallback", usage
+    
+    @staticmethod
+    def _no_data_result() -> Dict:
+        return {
+            "response": "Sorry, I couldn't load restaurant data. Please try again.",
+            "source": "error",
+            "usage": None,
+            "latency_ms": 0.0
+        }
+    
+    def stream_query(self, question: str, memory: Optional[ConversationMemory] = None) -> Iterator[str]:
+        """Process user query, yielding response text as the model generates it"""
+        start = time.perf_counter()
+        
+        data = self.data
+        if not data:
+            yield self._no_data_result()["response"]
+            return
+        
+        result, cache_key = self._shortcut(question, data, memory)
+        if result is not None:
+            result["latency_ms"] = result["first_token_ms"] = (time.perf_counter() - start) * 1000
+            yield result["response"]
+            if memory is not None:
+                memory.add(question, result["response"])
+            self._record(result)
+            return
+        
+        usage = None
+        first_token_ms = None
+        parts = []
+        source = "llm"
+        
+        inputs = None
+        if self.chain and self.breaker.allow():
             try:
-                response = self.chain.invoke({
-                    "context": context,
-                    "question": question
-                })
-                return response.strip()
+                inputs, usage = self._prepare_inputs(data, question, memory)
+            except Exception as e:
+                # Not the provider's fault: fall back without touching the breaker
+                print(f" Prompt error: {e}")
+                source = "fallback"
+        else:
+            source = "fallback"
+        
+        if inputs is not None:
+            try:
+                for chunk in self.chain.stream(inputs):
+                    if not parts:
+                        chunk = chunk.lstrip()
+                        if not chunk:
+                            continue
+                        first_token_ms = (time.perf_counter() - start) * 1000
+                    parts.append(chunk)
+                    yield chunk
+                self.breaker.record(bool(parts), first_token_ms or 0.0)
+                if not parts:
+                    # Stream ended with no text: answer from the data instead
+                    source = "fallback"
             except Exception as e:
                 print(f" LLM error: {e}")
-                return self._fallback_response(question)
+                self.breaker.record(False)
+                if parts:
+                    # Partial answer already shown; nothing sensible to append
+                    source = "llm_partial"
+                else:
+                    source = "fallback"
+        
+        if source == "fallback":
+            fallback = self._fallback_response(question, data)
+            first_token_ms = (time.perf_counter() - start) * 1000
+            parts = [fallback]
+            yield fallback
+        
+        result = {
+            "response": "".join(parts).strip(),
+            "source": source,
+            "usage": usage,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+            "first_token_ms": first_token_ms
+        }
+        if cache_key and source == "llm" and result["response"]:
+            self.response_cache.put(cache_key, result["response"], result["latency_ms"])
+        if memory is not None:
+            memory.add(question, result["response"])
+        self._record(result)
+    
+    def _prepare_inputs(
+        self,
+        data: RestaurantData,
+        question: str,
+        memory: Optional[ConversationMemory] = None
+    ) -> Tuple[Dict, Dict]:
+        """Chain inputs within the input token budget, with per-part token counts"""
+        question_tokens = self.tokens.count(question)
+        history = memory.messages() if memory else []
+        history_tokens = memory.tokens if memory else 0
+        overhead = self._prompt_tokens + question_tokens + history_tokens
+        usage = {
+            "prompt_tokens": self._prompt_tokens,
+            "question_tokens": question_tokens,
+            "history_tokens": history_tokens,
+            "budget": self.budget.max_input_tokens,
+            "exact": self.tokens.exact
+        }
+        
+        if Config.PROMPT_LAYOUT == "prefix":
+            # Static data in the system message, byte-identical until the data
+            # changes; only the clock-dependent status follows with the question
+            static, static_tokens, reused = self._static_prefix(data)
+            status = data.context_segment("status")
+            context_tokens = static_tokens + self.tokens.count(status)
+            if overhead + context_tokens <= self.budget.max_input_tokens:
+                usage.update({
+                    "context_tokens": context_tokens,
+                    "input_tokens": overhead + context_tokens,
+                    "trim_level": 0,
+                    "layout": "prefix",
+                    "prefix_tokens": static_tokens,
+                    "prefix_reused": reused
+                })
+                return {"static_context": static, "history": history, "context": status, "question": question}, usage
+        
+        # Inline: question-specific context, trimmed to fit (also when the
+        # static prefix alone is over budget)
+        if Config.RETRIEVAL_ENABLED:
+            selection = self.retriever.select(data, question)
         else:
-            # No LLM, use fallback
-            return self._fallback_response(question)
-    
-    def _fallback_response(self, question: str) -> str:
-        """Smart fallback when LLM not available"""
-        q = question.lower()
-        
-        # Timing questions
-        if any(w in q for w in ["open", "close", "time", "hour", "when"]):
-            status = self.data.is_open_now()
-            if status["is_open"]:
-                return f" Yes! We're currently OPEN.\n\n📍 Today ({status['day']}): {status['opens']} - {status['closes']}\n\nWelcome to Fast Food Restaurant! 🍔"
-            else:
-                return f" Sorry, we're currently CLOSED.\n\n📍 Today ({status['day']}): {status['opens']} - {status['closes']}\n\nSee you soon! 🍔"
-        
-        # Location questions
-        if any(w in q for w in ["where", "location", "address", "phone", "contact"]):
-            info = self.data.info
-            return f"📍 **{info.get('Name', 'HFC')}**\n\nAddress: {info.get('Address', 'N/A')}\nPhone: {info.get('Phone', 'N/A')}\n\n100% Halal Certified ☪️"
-        
-        # Menu questions
-        if any(w in q for w in ["menu", "food", "eat", "price", "chicken", "burger"]):
-            cats = self.data.get_categories()
-            if cats:
-                return f"🍔 **Our Menu Categories:**\n\n" + "\n".join([f"• {c}" for c in cats]) + "\n\nAsk about any category!"
-            return "We have delicious fried chicken, burgers, sides and drinks! 🍔"
-        
-        # Recommendations
-        if any(w in q for w in ["recommend", "suggest", "best", "popular", "favorite"]):
-            best = self.data.get_bestsellers()
-            if best:
-                res = "⭐ **Our Bestsellers:**\n\n"
-                for item in best[:5]:
-                    res += f"• {item.get('Item_Name', '')} - ${item.get('Regular_Price', '')}\n"
-                return res + "\nCustomer favorites! 🍔"
-            return "Try our signature fried chicken - it's amazing! 🍔"
-        
-        # Default welcome
-        info = self.data.info
-        return f"Welcome to **{info.get('Name', 'HFC')}**! 🍔\n\n100% Halal Certified ☪️\nRating: {info.get('Rating', 'N/A')} ⭐\n\nAsk me about menu, hours, or location!"
+            selection = self.retriever.select_all(data, question)
+        context, context_tokens, trim_level = self.budget.fit(selection, overhead)
+        
+        usage.update({
+            "context_tokens": context_tokens,
+            "input_tokens": overhead + context_tokens,
+            "trim_level": trim_level,
+            "layout": "inline"
+        })
+        return {"static_context": "", "history": history, "context": context, "question": question}, usage
+    
+    def _static_prefix(self, data: RestaurantData) -> Tuple[str, int, bool]:
+        """(system-message data block, its tokens, same block as the previous prompt)"""
+        raw = data.static_context()
+        previous = self._prefix
+        if previous and previous[0] is raw:
+            return previous[1], previous[2], True
+        
+        block = HFCPrompts.STATIC_CONTEXT_TEMPLATE.format(context=raw)
+        reused = bool(previous) and previous[1] == block
+        self._prefix = (raw, block, self.tokens.count(block))
+        return block, self._prefix[2], reused
+    
+    def _record(self, result: Dict):
+        """Keep recent per-request usage and flag oversized prompts"""
+        self.recent_usage.append({k: v for k, v in result.items() if k != "response"})
+        usage = result["usage"]
+        if usage:
+            first_token = result.get("first_token_ms")
+            ttft = f", first token {first_token:.0f} ms" if first_token is not None else ""
+            
+            layout = usage["layout"]
+            if layout == "prefix":
+                layout = "prefix_reused" if usage["prefix_reused"] else "prefix_new"
+            if result["source"].startswith("llm"):
+                totals = self.layout_latency.setdefault(layout, [0, 0.0])
+                totals[0] += 1
+                totals[1] += first_token if first_token is not None else result["latency_ms"]
+            
+            print(f" Tokens in: {usage['input_tokens']} (context {usage['context_tokens']}, {layout}) "
+                  f"- {result['latency_ms']:.0f} ms{ttft}")
+            if usage["trim_level"]:
+                print(f" Context trimmed to fit {usage['budget']} tokens (level {usage['trim_level']})")
+        elif result["source"] == "cache":
+            stats = self.response_cache.report()
+            print(f" Cache hit - {result['latency_ms']:.1f} ms (hit rate {stats['hit_rate']:.0%}, "
+                  f"saved {stats['saved_ms'] / 1000:.1f}s so far)")
+    
+    def _fallback_response(self, question: str, data: Optional[RestaurantData] = None) -> str:
+        """Smart fallback when LLM not available: best intent guess, however unsure"""
+        data = data or self.data
+        intent, _ = self.router.classify(question)
+        return self.router.respond(intent, data, question)
     
     def get_status(self) -> dict:
         """Get quick status for UI"""
-        if not self.data:
+        data = self.data
+        if not data:
             return {"is_open": False, "name": "HFC"}
         
-        status = self.data.is_open_now()
+        status = data.is_open_now()
         return {
-            "name": self.data.info.get("Name", "HFC"),
+            "name": data.info.get("Name", "HFC"),
             "is_open": status["is_open"],
             "time": status["time"],
-            "rating": self.data.info.get("Rating", "N/A")
+            "rating": data.info.get("Rating", "N/A"),
+            "data_version": data.version,
+            "response_cache": self.response_cache.report() if self.response_cache else None,
+            "llm_circuit": self.breaker.state,
+            "layout_latency_ms": {k: total / n for k, (n, total) in self.layout_latency.items()},
+            "hedging": self.chain.tracker.report() if isinstance(self.chain, HedgedChain) else None
         }
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+LLM Client - Time-bounded, pooled ChatOpenAI with retries and a circuit breaker
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from configure import Config
+
+# httpx / openai / langchain_openai load on first use (about a second of imports)
+if TYPE_CHECKING:
+    import httpx
+
+_http_client: Optional["httpx.Client"] = None
+_http_lock = threading.Lock()
+_local = threading.local()  # .handle: StreamHandle of the stream running on this thread
+
+
+def retryable_errors() -> Tuple[type, ...]:
+    """Worth retrying: the request may well succeed a moment later"""
+    import openai
+
+    return (
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+def shared_http_client() -> "httpx.Client":
+    """One keep-alive connection pool for every sync LLM call in the process"""
+    import httpx
+
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=llm_timeout(),
+                limits=httpx.Limits(
+                    max_connections=Config.LLM_POOL_SIZE,
+                    max_keepalive_connections=Config.LLM_POOL_SIZE
+                ),
+                event_hooks={"response": [_on_response]}
+            )
+        return _http_client
+
+
+def _on_response(response: "httpx.Response"):
+    """Hand the response to the stream handle of this thread, if any"""
+    handle = getattr(_local, "handle", None)
+    if handle is not None:
+        handle.response = response
+        if handle.cancelled.is_set():
+            handle.abort()
+
+
+class StreamHandle:
+    """Cancel a sync LLM stream running on another thread by closing its connection
+
+    The thread runs its stream inside `bind()`; the shared client's response
+    hook records the HTTP response there. `cancel()` shuts the socket down,
+    which wakes a read blocked waiting for the first token. A request still
+    waiting for response headers is aborted as soon as they arrive.
+    """
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.response: Optional["httpx.Response"] = None
+
+    @contextmanager
+    def bind(self):
+        _local.handle = self
+        try:
+            yield self
+        finally:
+            _local.handle = None
+
+    def cancel(self):
+        if self.cancelled.is_set():
+            return
+        self.cancelled.set()
+        self.abort()
+
+    def abort(self):
+        response = self.response
+        if response is None or response.is_closed:
+            return  # a finished response's connection may be back in the pool
+        stream = response.extensions.get("network_stream")
+        sock = stream.get_extra_info("socket") if stream is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed
+
+
+def stream_cancelled() -> bool:
+    """Whether the stream running on this thread has been cancelled"""
+    handle = getattr(_local, "handle", None)
+    return handle is not None and handle.cancelled.is_set()
+
+
+def llm_timeout() -> "httpx.Timeout":
+    import httpx
+
+    return httpx.Timeout(Config.LLM_READ_TIMEOUT, connect=Config.LLM_CONNECT_TIMEOUT)
+
+
+def create_chat_model(api_key: str, model: Optional[str] = None):
+    """ChatOpenAI with explicit timeouts and jittered retries on transient errors
+
+    The OpenAI SDK's own retries are turned off so the attempt count is set in
+    one place. Async calls keep the SDK's default client (an httpx.AsyncClient
+    is tied to the event loop that created it).
+    """
+    from langchain_openai import ChatOpenAI
+
+    llm = ChatOpenAI(
+        base_url=Config.LLM_BASE_URL,
+        api_key=api_key,
+        model=model or Config.LLM_MODEL,
+        temperature=Config.LLM_TEMPERATURE,
+        max_tokens=Config.LLM_MAX_TOKENS,
+        timeout=llm_timeout(),
+        max_retries=0,
+        http_client=shared_http_client()
+    )
+    if Config.LLM_MAX_RETRIES <= 0:
+        return llm
+    return llm.with_retry(
+        retry_if_exception_type=retryable_errors(),
+        wait_exponential_jitter=True,
+        stop_after_attempt=1 + Config.LLM_MAX_RETRIES
+    )
+
+
+def retry_wait(attempt: int) -> float:
+    """Exponential backoff with jitter, as with_retry waits between attempts"""
+    return min(2 ** attempt, 10) + random.uniform(0, 1)
+
+
+class StreamRetry:
+    """Chain wrapper that retries a stream until its first chunk arrives
+
+    with_retry only covers invoke / batch; its stream passes straight through.
+    Once a chunk has been yielded it is on screen, so later errors propagate.
+    Everything else is delegated to the wrapped chain.
+    """
+
+    def __init__(self, chain, retries: Optional[int] = None):
+        self.chain = chain
+        self.retries = max(0, Config.LLM_MAX_RETRIES if retries is None else retries)
+
+    def __getattr__(self, name: str):
+        return getattr(self.chain, name)
+
+    def stream(self, inputs: Dict, **kwargs):
+        errors = retryable_errors()
+        for attempt in range(self.retries + 1):
+            stream = iter(self.chain.stream(inputs, **kwargs))
+            try:
+                first = next(stream)
+            except StopIteration:
+                return
+            except errors as e:
+                if attempt == self.retries or stream_cancelled():
+                    raise
+                print(f" LLM stream retry {attempt + 1}/{self.retries}: {e}")
+                time.sleep(retry_wait(attempt))
+                continue
+            try:
+                yield first
+                yield from stream
+            finally:
+                stream.close()
+            return
+
+    async def astream(self, inputs: Dict, **kwargs):
+        errors = retryable_errors()
+        for attempt in range(self.retries + 1):
+            stream = self.chain.astream(inputs, **kwargs).__aiter__()
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                return
+            except errors as e:
+                if attempt == self.retries:
+                    raise
+                print(f" LLM stream retry {attempt + 1}/{self.retries}: {e}")
+                await asyncio.sleep(retry_wait(attempt))
+                continue
+            try:
+                yield first
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await stream.aclose()
+            return
+
+
+class CircuitBreaker:
+    """Skip the LLM for a cooldown after repeated failures or slow responses
+
+    closed: calls go through. open: calls are refused until the cooldown ends.
+    half-open: one probe call goes through; success closes, failure re-opens.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        slow_call_ms: Optional[float] = None,
+        cooldown: Optional[float] = None
+    ):
+        self.failure_threshold = failure_threshold or Config.LLM_BREAKER_FAILURES
+        self.slow_call_ms = slow_call_ms or Config.LLM_SLOW_CALL_MS
+        self.cooldown = Config.LLM_BREAKER_COOLDOWN if cooldown is None else cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+        self.stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half-open" if self._probing else "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go to the LLM now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.cooldown:
+                # Restart the window so a probe that never reports back can't wedge the breaker
+                self._opened_at = now
+                self._probing = True
+                return True
+            self.stats["rejected"] += 1
+            return False
+
+    def record(self, ok: bool, latency_ms: float = 0.0):
+        """Outcome of an allowed call; slow successes count as failures"""
+        with self._lock:
+            if ok and latency_ms <= self.slow_call_ms:
+                self._failures = 0
+                self._opened_at = None
+                self._probing = False
+                return
+
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    self.stats["opened"] += 1
+                    print(f" LLM circuit open for {self.cooldown:.0f}s after {self._failures} failed/slow calls")
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def report(self) -> Dict:
+        with self._lock:
+            return {"state": self.state, "failures": self._failures, **self.stats}
@@ -0,0 +1,226 @@
+"""
+Hedged Requests - Race a backup model when the primary is slow to its first token
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from configure import Config
+from src.llm.client import StreamHandle
+
+_DONE = object()
+
+
+class HedgeTracker:
+    """Primary first-token latencies -> hedge delay; hedge rate and time saved"""
+
+    def __init__(
+        self,
+        percentile: Optional[float] = None,
+        min_delay_ms: Optional[float] = None,
+        initial_delay_ms: Optional[float] = None,
+        window: int = 200
+    ):
+        self.percentile = percentile or Config.HEDGE_PERCENTILE
+        self.min_delay_ms = Config.HEDGE_MIN_DELAY_MS if min_delay_ms is None else min_delay_ms
+        self.initial_delay_ms = initial_delay_ms or Config.HEDGE_INITIAL_DELAY_MS
+        self.samples = deque(maxlen=window)
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "failovers": 0, "saved_ms": 0.0}
+        self._lock = threading.Lock()
+
+    def delay_ms(self) -> float:
+        """Send a hedge once the primary is slower than this percentile of recent calls"""
+        with self._lock:
+            if len(self.samples) < 20:
+                return self.initial_delay_ms
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay_ms, ordered[index])
+
+    def finish(self, hedged: bool, winner: int, first_token_ms: float, failover: bool = False):
+        """Record one call; winner is the model index whose answer was kept
+
+        failover: the primary failed, so a backup answering is no time saved.
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["hedged"] += hedged
+            if winner == 0:
+                self.samples.append(first_token_ms)
+                return
+            if failover:
+                self.stats["failovers"] += 1
+                return
+
+            self.stats["hedge_wins"] += 1
+            # Primary was cancelled; estimate when it would have answered from
+            # recent calls that were at least as slow as this one got
+            slower = [s for s in self.samples if s > first_token_ms]
+            if slower:
+                self.stats["saved_ms"] += sum(slower) / len(slower) - first_token_ms
+            # Censored sample: the primary took at least this long
+            self.samples.append(first_token_ms)
+
+    def report(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["hedge_rate"] = stats["hedged"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+
+class HedgedChain:
+    """Same interface as the LLM chain; streams from whichever model answers first
+
+    Models are tried in order: the next one is started when the current leader
+    has produced no token within the hedge delay (or failed). The first model to
+    produce a token wins and the others are cancelled.
+    """
+
+    def __init__(self, chains: Sequence, names: Sequence[str], tracker: Optional[HedgeTracker] = None):
+        self.chains = list(chains)
+        self.names = list(names)
+        self.tracker = tracker or HedgeTracker()
+
+    def _pick(self, state: Dict, index: int, chunk, error) -> bool:
+        """Update race state with one event; True when it belongs to the winner"""
+        if state["winner"] is None:
+            if error is not None or chunk is _DONE:
+                state["failed"].add(index)
+                return False
+            if not chunk.strip():
+                return False
+            state["winner"] = index
+            first_token_ms = (time.perf_counter() - state["start"]) * 1000
+            self.tracker.finish(state["hedged"], index, first_token_ms, failover=0 in state["failed"])
+        return index == state["winner"]
+
+    def _next_launch(self, state: Dict) -> bool:
+        """Whether another model should start now that all running ones failed"""
+        if state["winner"] is not None or len(state["failed"]) < state["launched"]:
+            return False
+        if state["launched"] < len(self.chains):
+            return True
+        raise state["error"] or RuntimeError("All models returned empty responses")
+
+    def stream(self, inputs: Dict) -> Iterator[str]:
+        results: "queue.Queue" = queue.Queue()
+        handles = [StreamHandle() for _ in self.chains]
+        state = {"start": time.perf_counter(), "launched": 0, "winner": None, "failed": set(), "error": None,
+                 "hedged": False}
+
+        def run(index: int):
+            handle = handles[index]
+            with handle.bind():
+                stream = self.chains[index].stream(inputs)
+                try:
+                    for chunk in stream:
+                        if handle.cancelled.is_set():
+                            break
+                        results.put((index, chunk, None))
+                    results.put((index, _DONE, None))
+                except Exception as e:
+                    results.put((index, None, e))
+                finally:
+                    stream.close()
+
+        def launch():
+            index = state["launched"]
+            state["launched"] += 1
+            state["launched_at"] = time.perf_counter()
+            threading.Thread(target=run, args=(index,), name=f"hfc-llm-{self.names[index]}", daemon=True).start()
+
+        delay = self.tracker.delay_ms() / 1000
+        launch()
+        try:
+            while True:
+                timeout = None
+                if state["winner"] is None and state["launched"] < len(self.chains):
+                    timeout = max(0.0, state["launched_at"] + delay - time.perf_counter())
+                try:
+                    index, chunk, error = results.get(timeout=timeout)
+                except queue.Empty:
+                    state["hedged"] = True
+                    launch()  # leader too slow to its first token: hedge
+                    continue
+
+                state["error"] = error or state["error"]
+                if not self._pick(state, index, chunk, error):
+                    if self._next_launch(state):
+                        launch()
+                    continue
+                # Losers are closed now, not when their next chunk arrives
+                for other, handle in enumerate(handles[:state["launched"]]):
+                    if other != index:
+                        handle.cancel()
+                if error is not None:
+                    raise error
+                if chunk is _DONE:
+                    return
+                yield chunk
+        finally:
+            for handle in handles[:state["launched"]]:
+                handle.cancel()
+
+    def invoke(self, inputs: Dict) -> str:
+        return "".join(self.stream(inputs))
+
+    async def astream(self, inputs: Dict):
+        results: "asyncio.Queue" = asyncio.Queue()
+        tasks: List[asyncio.Task] = []
+        state = {"start": time.perf_counter(), "launched": 0, "winner": None, "failed": set(), "error": None,
+                 "hedged": False}
+
+        async def run(index: int):
+            try:
+                async for chunk in self.chains[index].astream(inputs):
+                    await results.put((index, chunk, None))
+                await results.put((index, _DONE, None))
+            except Exception as e:
+                await results.put((index, None, e))
+
+        def launch():
+            state["launched"] += 1
+            state["launched_at"] = time.perf_counter()
+            tasks.append(asyncio.ensure_future(run(len(tasks))))
+
+        delay = self.tracker.delay_ms() / 1000
+        launch()
+        try:
+            while True:
+                timeout = None
+                if state["winner"] is None and state["launched"] < len(self.chains):
+                    timeout = max(0.0, state["launched_at"] + delay - time.perf_counter())
+                try:
+                    index, chunk, error = await asyncio.wait_for(results.get(), timeout)
+                except asyncio.TimeoutError:
+                    state["hedged"] = True
+                    launch()
+                    continue
+
+                state["error"] = error or state["error"]
+                if not self._pick(state, index, chunk, error):
+                    if self._next_launch(state):
+                        launch()
+                    continue
+                for other, task in enumerate(tasks):
+                    if other != index:
+                        task.cancel()
+                if error is not None:
+                    raise error
+                if chunk is _DONE:
+                    return
+                yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def ainvoke(self, inputs: Dict) -> str:
+        return "".join([chunk async for chunk in self.astream(inputs)])
+
+    def batch_as_completed(self, inputs: List[Dict], config: Optional[Dict] = None, return_exceptions: bool = False):
+        """Batches are throughput work: primary model only, no hedging"""
+        return self.chains[0].batch_as_completed(inputs, config=config, return_exceptions=return_exceptions)
@@ -4,5 +4,10 @@ HFC LLM Module
 
 from src.llm.prompts import HFCPrompts
 from src.llm.chains import HFCAgent
+from src.llm.cache import ResponseCache
+from src.llm.router import IntentRouter
+from src.llm.client import CircuitBreaker
+from src.llm.hedging import HedgedChain
+from src.llm.memory import ConversationMemory
 
-__all__ = ["HFCPrompts", "HFCAgent"]
\ No newline at end of file
+__all__ = ["HFCPrompts", "HFCAgent", "ResponseCache", "IntentRouter", "CircuitBreaker", "HedgedChain", "ConversationMemory"]
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Conversation Memory - Recent turns verbatim, older turns folded into a rolling summary
+"""
+
+import re
+import threading
+from collections import deque
+from typing import List, Optional, Tuple
+
+from configure import Config
+from src.llm.tokens import TokenCounter
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+class ConversationMemory:
+    """Per-conversation history kept within a token budget
+
+    Turns are added as they happen. When the verbatim turns go over budget the
+    oldest ones are folded into the summary one at a time, so the summary is
+    only ever extended (and trimmed from the front), never rebuilt.
+    """
+
+    MIN_RECENT_TURNS = 1  # always keep the last exchange verbatim ("how much is that one?")
+    SUMMARY_ANSWER_CHARS = 160
+
+    def __init__(
+        self,
+        counter: Optional[TokenCounter] = None,
+        max_tokens: Optional[int] = None,
+        max_summary_tokens: Optional[int] = None
+    ):
+        self.counter = counter or TokenCounter()
+        self.max_tokens = max_tokens or Config.MEMORY_MAX_TOKENS
+        self.max_summary_tokens = max_summary_tokens or Config.MEMORY_SUMMARY_MAX_TOKENS
+        self.turns: "deque[Tuple[str, str, int]]" = deque()  # (question, answer, tokens)
+        self.summary_lines: "deque[Tuple[str, int]]" = deque()  # (line, tokens)
+        self.turn_tokens = 0
+        self.summary_tokens = 0
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.turns or self.summary_lines)
+
+    @property
+    def tokens(self) -> int:
+        return self.turn_tokens + self.summary_tokens
+
+    def add(self, question: str, answer: str):
+        """Record one exchange, folding old turns into the summary if over budget"""
+        tokens = self.counter.count(question) + self.counter.count(answer)
+        with self._lock:
+            self.turns.append((question, answer, tokens))
+            self.turn_tokens += tokens
+
+            while self.tokens > self.max_tokens and len(self.turns) > self.MIN_RECENT_TURNS:
+                old_question, old_answer, old_tokens = self.turns.popleft()
+                self.turn_tokens -= old_tokens
+                self._fold(old_question, old_answer)
+
+    def _fold(self, question: str, answer: str):
+        """Append one summary line for a turn; drop the oldest lines past the cap"""
+        line = f"- Customer asked: {question.strip()} | Assistant: {self.gist(answer)}"
+        tokens = self.counter.count(line)
+        self.summary_lines.append((line, tokens))
+        self.summary_tokens += tokens
+
+        while self.summary_tokens > self.max_summary_tokens and len(self.summary_lines) > 1:
+            _, dropped = self.summary_lines.popleft()
+            self.summary_tokens -= dropped
+
+    @classmethod
+    def gist(cls, answer: str) -> str:
+        """First sentence of an answer, single line, length-capped"""
+        text = " ".join(answer.split())
+        first = _SENTENCE_RE.split(text, 1)[0]
+        if len(first) > cls.SUMMARY_ANSWER_CHARS:
+            first = first[:cls.SUMMARY_ANSWER_CHARS].rsplit(" ", 1)[0] + "…"
+        return first
+
+    def messages(self) -> List[Tuple[str, str]]:
+        """History for the prompt's MessagesPlaceholder: summary, then recent turns"""
+        with self._lock:
+            history = []
+            if self.summary_lines:
+                summary = "\n".join(line for line, _ in self.summary_lines)
+                history.append(("system", f"Earlier in this conversation:\n{summary}"))
+            for question, answer, _ in self.turns:
+                history.append(("human", question))
+                history.append(("ai", answer))
+            return history
+
+    def clear(self):
+        with self._lock:
+            self.turns.clear()
+            self.summary_lines.clear()
+            self.turn_tokens = 0
+            self.summary_tokens = 0
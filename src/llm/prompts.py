@@ -19,6 +19,13 @@ Your role:
 
 IMPORTANT: Only use information from the provided context. Never make up data."""
 
+    # Prefix layout: static restaurant data appended to the system message
+    STATIC_CONTEXT_TEMPLATE = """
+
+=== RESTAURANT DATA ===
+{context}
+=== END DATA ==="""
+
     HUMAN_TEMPLATE = """Use the following restaurant information to answer my question.
 
 === RESTAURANT DATA ===
@@ -33,6 +40,8 @@ Please provide a helpful response:"""
     def get_chat_prompt(cls) -> ChatPromptTemplate:
         """Get chat prompt template"""
         return ChatPromptTemplate.from_messages([
-            ("system", cls.SYSTEM),
+            ("system", cls.SYSTEM + "{static_context}"),
+            # Rolling summary + recent turns (after the static prefix so it stays cacheable)
+            MessagesPlaceholder(variable_name="history", optional=True),
             ("human", cls.HUMAN_TEMPLATE)
         ])
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Context Retrieval - Send the LLM only the menu slices a question needs
+"""
+
+from typing import Dict, List, Optional, Set
+
+from configure import Config
+from src.data.models import MenuItem, RestaurantData
+from src.data.search import STOPWORDS, tokenize
+
+
+def _stem(token: str) -> str:
+    return token[:-1] if len(token) > 3 and token.endswith("s") else token
+
+
+class ContextSelection:
+    """Menu items picked for one question, renderable with different trims"""
+
+    def __init__(
+        self,
+        data: RestaurantData,
+        fixed: List[str],
+        ranked: List[MenuItem],
+        matched: Set[str],
+        full: bool = False
+    ):
+        self.data = data
+        self.fixed = fixed  # info / status / hours segments, always sent
+        self.ranked = ranked  # most relevant first
+        self.matched = matched  # categories the question is about
+        self.full = full  # ranked holds the whole menu
+
+    def items(
+        self,
+        include_unavailable: bool = True,
+        only_matched: bool = False,
+        max_items: Optional[int] = None
+    ) -> List[MenuItem]:
+        """Ranked items left after a trim"""
+        items = self.ranked
+        if not include_unavailable:
+            items = [item for item in items if item.available]
+        if only_matched:
+            items = [item for item in items if item.category in self.matched]
+        if max_items is not None:
+            items = items[:max_items]
+        return items
+
+    def render(
+        self,
+        include_unavailable: bool = True,
+        include_descriptions: bool = True,
+        only_matched: bool = False,
+        max_items: Optional[int] = None
+    ) -> str:
+        """Context text in the RestaurantData.to_context layout"""
+        data = self.data
+        parts = list(self.fixed)
+        items = self.items(include_unavailable, only_matched, max_items)
+
+        if self.full and items is self.ranked and not include_descriptions:
+            # Untrimmed full menu: reuse the cached segment
+            parts.append(data.context_segment("menu"))
+        else:
+            positions = data.menu_index["positions"]
+            grouped: Dict[str, List[MenuItem]] = {}
+            for item in sorted(items, key=lambda it: positions[id(it)]):
+                grouped.setdefault(item.category or "Other", []).append(item)
+
+            parts.append("\n📋 MENU:\n")
+            parts.append(f"Categories: {', '.join(data.get_categories())}\n")
+            if len(items) < len(data.menu):
+                parts.append(f"(Showing {len(items)} of {len(data.menu)} items relevant to the question)\n")
+            for category, cat_items in grouped.items():
+                parts.append(RestaurantData.format_category(category, cat_items, include_descriptions))
+
+        parts.append(data.context_segment("facilities"))
+        return "".join(parts)
+
+
+class ContextRetriever:
+    """Build a question-specific context: fixed info/status blocks + ranked menu slices"""
+
+    # Always included: small and needed for most answers
+    FIXED_SEGMENTS = ("info", "status", "weekly_hours", "meals")
+
+    MENU_WORDS = {"menu", "categories", "category", "serve", "food", "eat", "options", "items"}
+    RECOMMEND_WORDS = {"recommend", "suggest", "best", "bestseller", "popular", "favorite", "favourite", "top"}
+    SAMPLE_PER_CATEGORY = 3
+
+    def __init__(self, max_items: Optional[int] = None, max_category_items: Optional[int] = None):
+        self.max_items = max_items or Config.RETRIEVAL_MAX_ITEMS
+        self.max_category_items = max_category_items or Config.RETRIEVAL_MAX_CATEGORY_ITEMS
+
+    def _matching_categories(self, data: RestaurantData, stems: set) -> List[str]:
+        """Categories whose every word appears in the question"""
+        matches = []
+        for category in data.get_categories():
+            words = [_stem(t) for t in tokenize(category) if t not in STOPWORDS]
+            if words and all(w in stems for w in words):
+                matches.append(category)
+        return matches
+
+    def _relevant(self, data: RestaurantData, question: str) -> Dict[int, MenuItem]:
+        """Items the question points at, most relevant first"""
+        tokens = set(tokenize(question))
+        stems = {_stem(t) for t in tokens}
+        selected: Dict[int, MenuItem] = {}
+
+        # Whole categories the question names ("show me your burgers")
+        for category in self._matching_categories(data, stems):
+            for item in data.get_menu_by_category(category)[:self.max_category_items]:
+                selected[id(item)] = item
+
+        # Recommendation questions get the bestsellers
+        if tokens & self.RECOMMEND_WORDS:
+            for item in data.get_bestsellers()[:self.max_items]:
+                selected[id(item)] = item
+
+        # BM25-ranked items for everything else the question mentions
+        for item in data.search_menu(question, limit=self.max_items):
+            selected.setdefault(id(item), item)
+
+        # "What's on the menu?" with nothing specific: a few items per category
+        if not selected and tokens & self.MENU_WORDS:
+            for items in data.menu_index["grouped"].values():
+                for item in items[:self.SAMPLE_PER_CATEGORY]:
+                    selected[id(item)] = item
+
+        return selected
+
+    def select(self, data: RestaurantData, question: str) -> ContextSelection:
+        """Only the relevant menu slices (whole menu if it is small anyway)"""
+        if len(data.menu) <= self.max_items:
+            return self.select_all(data, question)
+
+        fixed = [data.context_segment(name) for name in self.FIXED_SEGMENTS]
+        relevant = self._relevant(data, question)
+        matched = {item.category for item in relevant.values()}
+        return ContextSelection(data, fixed, list(relevant.values()), matched)
+
+    def select_all(self, data: RestaurantData, question: str) -> ContextSelection:
+        """Whole menu, relevant items ranked first (used when retrieval is off)"""
+        fixed = [data.context_segment(name) for name in self.FIXED_SEGMENTS]
+        relevant = self._relevant(data, question)
+        rest = [item for item in data.menu if id(item) not in relevant]
+        matched = {item.category for item in relevant.values()}
+        return ContextSelection(data, fixed, list(relevant.values()) + rest, matched, full=True)
+
+    def build_context(self, data: RestaurantData, question: str) -> str:
+        """Context for one question, same layout as RestaurantData.to_context"""
+        return self.select(data, question).render(include_descriptions=False)
@@ -0,0 +1,192 @@
+"""
+Intent Router - Answer structured questions straight from RestaurantData
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from configure import Config
+from src.data.models import RestaurantData
+from src.data.search import STOPWORDS
+
+# intent -> {pattern: weight}; a question's intent score is the sum of its matched weights
+INTENTS: Dict[str, Dict[str, float]] = {
+    "hours": {
+        r"open(ed|ing)?": 0.6,
+        r"clos(e|ed|es|ing)": 0.6,
+        r"hours?": 0.8,
+        r"timings?": 0.8,
+        r"what time": 0.6,
+        r"when": 0.3,
+        r"now|today|tonight": 0.2,
+        r"(mon|tues|wednes|thurs|fri|satur|sun)days?|tomorrow|weekends?|weekdays?": 0.1,
+    },
+    "location": {
+        r"where": 0.5,
+        r"locat(ed|ion)": 0.8,
+        r"address": 0.9,
+        r"directions?": 0.7,
+        r"phone( number)?": 0.9,
+        r"contact": 0.7,
+        r"call": 0.4,
+    },
+    "menu": {
+        r"menu": 0.8,
+        r"categor(y|ies)": 0.7,
+        r"what do you (serve|sell|have)": 0.6,
+        r"food|eat": 0.3,
+        r"prices?|chicken|burgers?": 0.2,
+    },
+    "recommend": {
+        r"recommend(ation)?s?": 0.8,
+        r"suggest(ion)?s?": 0.7,
+        r"best ?sellers?": 0.9,
+        r"popular": 0.8,
+        r"favou?rites?": 0.6,
+        r"best": 0.4,
+    },
+}
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_DAY_RE = re.compile(r"\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday|tomorrow|weekend|weekday)s?\b")
+# Asking for the schedule rather than "are you open right now"
+_SCHEDULE_RE = re.compile(r"\b(hours?|timings?|schedule)\b")
+_NOW_RE = re.compile(r"\b(now|today|tonight|right now|currently)\b")
+
+
+def days_in(question: str) -> List[str]:
+    """Weekday names a question asks about ("tomorrow" and "weekend" resolved)"""
+    days: List[str] = []
+    for match in _DAY_RE.finditer(question.lower()):
+        word = match.group(1)
+        if word == "tomorrow":
+            names = ((datetime.now() + timedelta(days=1)).strftime("%A"),)
+        elif word == "weekend":
+            names = WEEKDAYS[5:]
+        elif word == "weekday":
+            names = WEEKDAYS[:5]
+        else:
+            names = (word.capitalize(),)
+        days.extend(d for d in names if d not in days)
+    return days
+
+
+class IntentRouter:
+    """Score intents with one compiled alternation; answer confident ones without the LLM"""
+
+    # Each content word the patterns don't explain lowers confidence by this share
+    UNCOVERED_PENALTY = 0.3
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = Config.ROUTER_THRESHOLD if threshold is None else threshold
+
+        self._weights: List[Tuple[str, float]] = []
+        alternatives = []
+        for intent, patterns in INTENTS.items():
+            for pattern, weight in patterns.items():
+                alternatives.append(f"(?P<p{len(self._weights)}>{pattern})")
+                self._weights.append((intent, weight))
+        self._matcher = re.compile(r"\b(?:" + "|".join(alternatives) + r")\b")
+        self._word = re.compile(r"[a-z0-9']+")
+
+    def classify(self, question: str) -> Tuple[Optional[str], float]:
+        """(best intent, confidence in 0..1); (None, 0.0) when nothing matches"""
+        q = question.lower()
+        scores: Dict[str, float] = {}
+        seen = set()
+        covered = []
+
+        for match in self._matcher.finditer(q):
+            index = int(match.lastgroup[1:])
+            if index in seen:
+                continue
+            seen.add(index)
+            intent, weight = self._weights[index]
+            scores[intent] = scores.get(intent, 0.0) + weight
+            covered.append(match.span())
+
+        if not scores:
+            return None, 0.0
+
+        intent, best = max(scores.items(), key=lambda kv: kv[1])
+        dominance = best / sum(scores.values())
+
+        uncovered = 0
+        for word in self._word.finditer(q):
+            token = word.group().replace("'", "")
+            if token in STOPWORDS or any(start <= word.start() < end for start, end in covered):
+                continue
+            uncovered += 1
+
+        confidence = min(best, 1.0) * dominance / (1 + self.UNCOVERED_PENALTY * uncovered)
+        return intent, confidence
+
+    def route(
+        self,
+        question: str,
+        data: RestaurantData,
+        threshold: Optional[float] = None
+    ) -> Optional[Tuple[str, str]]:
+        """(intent, answer) when confident enough to skip the LLM, else None"""
+        intent, confidence = self.classify(question)
+        if intent is None or confidence < (self.threshold if threshold is None else threshold):
+            return None
+        if intent == "hours" and self.weekly_hours(data, days_in(question)) is None:
+            return None  # no weekly timings for the day(s) asked about
+        return intent, self.respond(intent, data, question)
+
+    @staticmethod
+    def weekly_hours(data: RestaurantData, days: Optional[List[str]] = None) -> Optional[str]:
+        """Opening hours of the given days (all listed days when None), None if missing"""
+        weekly = {t.get("day"): t for t in data.timings.get("weekly", [])}
+        days = days or [d for d in WEEKDAYS if d in weekly]
+        if not days or any(d not in weekly for d in days):
+            return None
+
+        lines = []
+        for day in days:
+            t = weekly[day]
+            if t.get("status", "").lower() == "open":
+                lines.append(f"• {day}: {t.get('opens', '')} - {t.get('closes', '')}")
+            else:
+                lines.append(f"• {day}: Closed")
+        return "🕐 **Opening Hours:**\n\n" + "\n".join(lines)
+
+    def respond(self, intent: Optional[str], data: RestaurantData, question: str = "") -> str:
+        """Deterministic answer for an intent (None = welcome message)"""
+        info = data.info
+
+        if intent == "hours":
+            # A named day, or the schedule in general: answer from the weekly table
+            q = question.lower()
+            days = days_in(q)
+            if days or (_SCHEDULE_RE.search(q) and not _NOW_RE.search(q)):
+                hours = self.weekly_hours(data, days)
+                if hours:
+                    return hours + "\n\nSee you soon! 🍔"
+
+            status = data.is_open_now()
+            if status["is_open"]:
+                return f" Yes! We're currently OPEN.\n\n📍 Today ({status['day']}): {status['opens']} - {status['closes']}\n\nWelcome to Fast Food Restaurant! 🍔"
+            return f" Sorry, we're currently CLOSED.\n\n📍 Today ({status['day']}): {status['opens']} - {status['closes']}\n\nSee you soon! 🍔"
+
+        if intent == "location":
+            return f"📍 **{info.get('Name', 'HFC')}**\n\nAddress: {info.get('Address', 'N/A')}\nPhone: {info.get('Phone', 'N/A')}\n\n100% Halal Certified ☪️"
+
+        if intent == "menu":
+            cats = data.get_categories()
+            if cats:
+                return f"🍔 **Our Menu Categories:**\n\n" + "\n".join([f"• {c}" for c in cats]) + "\n\nAsk about any category!"
+            return "We have delicious fried chicken, burgers, sides and drinks! 🍔"
+
+        if intent == "recommend":
+            best = data.get_bestsellers()
+            if best:
+                res = "⭐ **Our Bestsellers:**\n\n"
+                for item in best[:5]:
+                    res += f"• {item.name} - ${item.price_text}\n"
+                return res + "\nCustomer favorites! 🍔"
+            return "Try our signature fried chicken - it's amazing! 🍔"
+
+        return f"Welcome to **{info.get('Name', 'HFC')}**! 🍔\n\n100% Halal Certified ☪️\nRating: {info.get('Rating', 'N/A')} ⭐\n\nAsk me about menu, hours, or location!"
@@ -0,0 +1,79 @@
+"""
+Token Accounting - Count prompt tokens and keep context within budget
+"""
+
+from typing import Optional, Tuple
+
+from configure import Config
+from src.llm.retrieval import ContextSelection
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character estimate
+    tiktoken = None
+
+
+class TokenCounter:
+    """tiktoken when installed, otherwise ~4 characters per token"""
+
+    def __init__(self, encoding: Optional[str] = None):
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding(encoding or Config.TOKENIZER_ENCODING)
+            except Exception as e:
+                print(f" Tokenizer unavailable, estimating tokens: {e}")
+
+    @property
+    def exact(self) -> bool:
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return (len(text) + 3) // 4
+
+
+class ContextBudget:
+    """Trim a context selection until the whole prompt fits the input budget"""
+
+    # Applied in order until the context fits
+    TRIMS = (
+        {},
+        {"include_unavailable": False},
+        {"include_unavailable": False, "include_descriptions": False},
+        {"include_unavailable": False, "include_descriptions": False, "only_matched": True},
+    )
+
+    def __init__(self, counter: TokenCounter, max_input_tokens: Optional[int] = None):
+        self.counter = counter
+        self.max_input_tokens = max_input_tokens or Config.LLM_MAX_INPUT_TOKENS
+
+    def fit(self, selection: ContextSelection, overhead_tokens: int) -> Tuple[str, int, int]:
+        """(context, context_tokens, trim_level); level 0 = untrimmed"""
+        available = self.max_input_tokens - overhead_tokens
+
+        for level, trim in enumerate(self.TRIMS):
+            context = selection.render(**trim)
+            tokens = self.counter.count(context)
+            if tokens <= available:
+                return context, tokens, level
+
+        # Last resort: keep only the top-ranked items that fit
+        trim = self.TRIMS[-1]
+        low, high = 0, len(selection.items(False, True))
+        context = selection.render(**trim, max_items=0)
+        tokens = self.counter.count(context)
+
+        while low < high:
+            middle = (low + high + 1) // 2
+            candidate = selection.render(**trim, max_items=middle)
+            candidate_tokens = self.counter.count(candidate)
+            if candidate_tokens <= available:
+                low, context, tokens = middle, candidate, candidate_tokens
+            else:
+                high = middle - 1
+
+        return context, tokens, len(self.TRIMS)
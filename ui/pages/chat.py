@@ -2,9 +2,18 @@
 HFC AI Assistant - Chat Page
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import streamlit as st
+from configure import Config
 from ui.components import Components
-from src.llm.chains import HFCAgent
+
+
+def build_agent():
+    """Import and construct the agent (LangChain, sheets fetch, warm indexes)"""
+    from src.llm.chains import HFCAgent
+    
+    return HFCAgent()
 
 
 class ChatPage:
@@ -12,9 +21,31 @@ class ChatPage:
     
     @staticmethod
     @st.cache_resource
+    def agent_future() -> Future:
+        """Agent built once per process on a background thread"""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hfc-agent-init")
+        future = executor.submit(build_agent)
+        executor.shutdown(wait=False)
+        return future
+    
+    @staticmethod
     def get_agent():
-        """Get cached agent (loads once)"""
-        return HFCAgent()
+        """Get cached agent (waits if it is still being built)"""
+        future = ChatPage.agent_future()
+        try:
+            return future.result()
+        except Exception:
+            ChatPage.agent_future.clear()  # retry on the next question
+            raise
+    
+    @staticmethod
+    def get_memory(agent):
+        """Conversation memory of this session (created with the first question)"""
+        if st.session_state.get("memory") is None:
+            from src.llm.memory import ConversationMemory
+            
+            st.session_state.memory = ConversationMemory(agent.tokens)
+        return st.session_state.memory
     
     @staticmethod
     def initialize_session():
@@ -32,13 +63,27 @@ class ChatPage:
         st.session_state.messages.append({"role": role, "content": content})
     
     @staticmethod
-    def get_response(question: str) -> str:
-        """Get AI Response"""
+    def stream_response(question: str):
+        """Yield AI response chunks as they arrive"""
         try:
             agent = ChatPage.get_agent()
-            return agent.process_query(question)
-        except Exception as e:
-            return "Sorry, something went wrong. Please try again."
+            yield from agent.stream_query(question, ChatPage.get_memory(agent))
+        except Exception:
+            yield "Sorry, something went wrong. Please try again."
+    
+    @staticmethod
+    def render_streamed_response(question: str) -> str:
+        """Render response tokens in place as they stream in"""
+        placeholder = st.empty()
+        placeholder.markdown(Components.thinking_indicator(), unsafe_allow_html=True)
+        
+        response = ""
+        for chunk in ChatPage.stream_response(question):
+            response += chunk
+            placeholder.markdown(Components.assistant_message(response + "▌"), unsafe_allow_html=True)
+        
+        placeholder.markdown(Components.assistant_message(response), unsafe_allow_html=True)
+        return response
     
     @staticmethod
     def render():
@@ -78,18 +123,15 @@ class ChatPage:
                 else:
                     st.markdown(Components.assistant_message(msg["content"]), unsafe_allow_html=True)
             
-            # Show Thinking if waiting
+            # Stream response if waiting (Thinking until the first token)
             if st.session_state.waiting_response:
-                st.markdown(Components.thinking_indicator(), unsafe_allow_html=True)
-                
                 # Get last user message
                 last_msg = st.session_state.messages[-1]["content"] if st.session_state.messages else ""
                 
-                # Get response
-                response = ChatPage.get_response(last_msg)
+                # Already on screen - no rerun needed
+                response = ChatPage.render_streamed_response(last_msg)
                 ChatPage.add_message("assistant", response)
                 st.session_state.waiting_response = False
-                st.rerun()
         
         # Spacing
         st.markdown("<div style='height: 80px;'></div>", unsafe_allow_html=True)
@@ -116,4 +158,8 @@ class ChatPage:
                 st.rerun()
         
         # Footer
-        Components.footer()
\ No newline at end of file
+        Components.footer()
+        
+        # Page is on screen: start building the agent before the first question
+        if Config.AGENT_PRELOAD:
+            ChatPage.agent_future()
\ No newline at end of file